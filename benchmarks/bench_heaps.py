@@ -0,0 +1,73 @@
+'''
+Compare the heaps in heap.py on insert-heavy, pop-heavy and mixed workloads.
+
+Run from the repository root:
+    python -m benchmarks.bench_heaps              # n = 10^5 operations
+    python -m benchmarks.bench_heaps 6            # n = 10^6 operations
+'''
+import random
+import sys
+import time
+from typing import Callable, Dict, List
+
+from data_structures.heap import DaryHeap, Heap, MinHeap, PairingHeap
+
+HEAPS: Dict[str, Callable[[], Heap]] = {
+    'MinHeap': MinHeap,
+    'DaryHeap(d=4)': lambda: DaryHeap(d=4),
+    'DaryHeap(d=8)': lambda: DaryHeap(d=8),
+    'PairingHeap': PairingHeap,
+}
+
+
+def insert_heavy(heap: Heap, values: List[float]) -> None:
+    '''
+    insert everything, pop a tenth
+    '''
+    for value in values:
+        heap.insert(value)
+    for _ in range(len(values) // 10):
+        heap.pop()
+
+
+def pop_heavy(heap: Heap, values: List[float]) -> None:
+    '''
+    insert everything, pop everything
+    '''
+    for value in values:
+        heap.insert(value)
+    while not heap.is_empty():
+        heap.pop()
+
+
+def mixed(heap: Heap, values: List[float]) -> None:
+    '''
+    random interleaving of inserts and pops, about two inserts per pop
+    '''
+    for value in values:
+        heap.insert(value)
+        if value < 0.33 and not heap.is_empty():
+            heap.pop()
+
+
+WORKLOADS: Dict[str, Callable[[Heap, List[float]], None]] = {
+    'insert-heavy': insert_heavy,
+    'pop-heavy': pop_heavy,
+    'mixed': mixed,
+}
+
+
+def main(exp: int = 5) -> None:
+    values = [random.random() for _ in range(10**exp)]
+    print(f'n=10^{exp}')
+    for workload_name, workload in WORKLOADS.items():
+        print(workload_name)
+        for heap_name, make_heap in HEAPS.items():
+            heap = make_heap()
+            start = time.perf_counter()
+            workload(heap, values)
+            print(f'    {heap_name:<16}{time.perf_counter() - start:10.4f}s')
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5)
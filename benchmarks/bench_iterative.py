@@ -0,0 +1,109 @@
+'''
+Compare the iterative quick_sort, quick_sort_3way and heap_sort in
+sorting.py against the recursive versions they replaced, which are kept
+below for reference.
+
+Run from the repository root:
+    python -m benchmarks.bench_iterative          # n up to 10^5
+    python -m benchmarks.bench_iterative 6        # n up to 10^6
+'''
+import random
+import sys
+import time
+from typing import Callable, Dict, List
+
+from data_structures import sorting
+from data_structures.sorting import partition
+
+
+def quick_sort_recursive(A: List[int]) -> None:
+
+    def sort(lo: int, hi: int) -> None:
+        if lo >= hi:
+            return
+        k = partition(A, lo, hi)
+        sort(lo, k-1)
+        sort(k+1, hi)
+
+    random.shuffle(A)
+    sort(0, len(A)-1)
+
+
+def quick_sort_3way_recursive(A: List[int]) -> None:
+
+    def partition3way(lo: int, hi: int) -> None:
+        if lo >= hi:
+            return
+        lt, gt = lo, hi
+        pivot_value = A[lo]
+        i = lo + 1
+
+        while i <= gt:
+            if A[i] < pivot_value:
+                A[i], A[lt] = A[lt], A[i]
+                i += 1
+                lt += 1
+            elif A[i] > pivot_value:
+                A[i], A[gt] = A[gt], A[i]
+                gt -= 1
+            else:
+                i += 1
+
+        partition3way(lo, lt-1)
+        partition3way(gt+1, hi)
+
+    random.shuffle(A)
+    partition3way(0, len(A) - 1)
+
+
+def heap_sort_recursive(A: List[int]) -> None:
+    def heapify(A: List[int], N: int, i: int) -> None:
+        largest = i
+        left = 2*i + 1
+        right = 2*i + 2
+        if left < N and A[largest] < A[left]:
+            largest = left
+        if right < N and A[largest] < A[right]:
+            largest = right
+        if largest != i:
+            A[i], A[largest] = A[largest], A[i]
+            heapify(A, N, largest)
+
+    N = len(A)
+    for i in range(N//2 - 1, -1, -1):
+        heapify(A, N, i)
+    for i in range(N-1, 0, -1):
+        A[i], A[0] = A[0], A[i]
+        heapify(A, i, 0)
+
+
+PAIRS: Dict[str, List[Callable[[List], None]]] = {
+    'quick_sort': [quick_sort_recursive, sorting.quick_sort],
+    'quick_sort_3way': [quick_sort_3way_recursive, sorting.quick_sort_3way],
+    'heap_sort': [heap_sort_recursive, sorting.heap_sort],
+}
+
+
+def best_of(f: Callable[[List], None], A: List[int], repeat: int = 3) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        B = A.copy()
+        start = time.perf_counter()
+        f(B)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(max_exp: int = 5) -> None:
+    sys.setrecursionlimit(10**6)
+    print(f'{"":<24}{"recursive":>12}{"iterative":>12}{"speedup":>10}')
+    for exp in range(3, max_exp + 1):
+        n = 10**exp
+        A = [random.randrange(n) for _ in range(n)]
+        for name, (recursive, iterative) in PAIRS.items():
+            r, i = best_of(recursive, A), best_of(iterative, A)
+            print(f'{name + f" n=10^{exp}":<24}{r:11.4f}s{i:11.4f}s{r / i:9.2f}x')
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5)
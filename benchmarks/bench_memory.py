@@ -0,0 +1,152 @@
+'''
+Measure bytes per element of each container with tracemalloc, and time
+push/pop churn on the linked stack and queue with and without a NodePool.
+The values stored are created before tracing starts, so only the
+container's own memory is counted.
+
+Run from the repository root:
+    python -m benchmarks.bench_memory             # n = 10^5 elements
+    python -m benchmarks.bench_memory 6           # n = 10^6 elements
+'''
+import sys
+import time
+import tracemalloc
+from typing import Callable, Dict, List
+
+from data_structures.heap import IndexedMinHeap, MinHeap, PairingHeap
+from data_structures.linked_lists import double_node, single_node
+from data_structures.linked_lists.SingleLL import LinkedList
+from data_structures.linked_lists.single_node import NodePool
+from data_structures.queues import LinkedListQueue
+from data_structures.stacks import LinkedListStack
+from data_structures.trees.array_tree import ArrayTree
+from data_structures.trees.avl import AVLTree
+from data_structures.trees.binary import BinaryTreeNode
+from data_structures.trees.sorted_map import SortedMap
+from data_structures.union_find import CompactUnionFind, UnionFind
+
+
+def linked_list(values: List[int]):
+    ll = LinkedList()
+    for x in values:
+        ll.push(x)
+    return ll
+
+
+def stack(values: List[int]):
+    s = LinkedListStack()
+    for x in values:
+        s.push(x)
+    return s
+
+
+def queue(values: List[int]):
+    q = LinkedListQueue()
+    for x in values:
+        q.push(x)
+    return q
+
+
+def complete_tree(values: List[int]):
+    '''
+    complete binary tree, filled level by level like binary.insert
+    '''
+    nodes = [BinaryTreeNode(x) for x in values]
+    for i in range(1, len(nodes)):
+        parent = nodes[(i - 1) // 2]
+        if i % 2:
+            parent.left = nodes[i]
+        else:
+            parent.right = nodes[i]
+    return nodes[0]
+
+
+def avl_tree(values: List[int]):
+    tree = AVLTree()
+    for x in values:
+        tree.insert(x)
+    return tree
+
+
+def min_heap(values: List[int]):
+    h = MinHeap()
+    for x in values:
+        h.insert(x)
+    return h
+
+
+def pairing_heap(values: List[int]):
+    h = PairingHeap()
+    for x in values:
+        h.insert(x)
+    return h
+
+
+def indexed_heap(values: List[int]):
+    h = IndexedMinHeap()
+    for x in values:
+        h.push(x, x)
+    return h
+
+
+CONTAINERS: Dict[str, Callable[[List[int]], object]] = {
+    'SingleLL.LinkedList': linked_list,
+    'single_node list': single_node.push_list,
+    'double_node list': double_node.push_list,
+    'LinkedListStack': stack,
+    'LinkedListQueue': queue,
+    'BinaryTreeNode tree': complete_tree,
+    'ArrayTree (typecode l)': lambda values: ArrayTree.from_binary_tree(complete_tree(values), 'l'),
+    'AVLTree': avl_tree,
+    'SortedMap': lambda values: SortedMap.from_sorted((x, None) for x in values),
+    'MinHeap': min_heap,
+    'PairingHeap': pairing_heap,
+    'IndexedMinHeap': indexed_heap,
+    'UnionFind': lambda values: UnionFind(len(values)),
+    'CompactUnionFind': lambda values: CompactUnionFind(len(values)),
+}
+
+
+def bytes_per_element(build: Callable[[List[int]], object], values: List[int]) -> float:
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        container = build(values)
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    del container
+    return (after - before) / len(values)
+
+
+def churn(make: Callable[[], object], n: int, batch: int = 1000) -> float:
+    '''
+    push and pop batch items n // batch times
+    '''
+    container = make()
+    start = time.perf_counter()
+    for _ in range(n // batch):
+        for x in range(batch):
+            container.push(x)
+        for _ in range(batch):
+            container.pop()
+    return time.perf_counter() - start
+
+
+def main(exp: int = 5) -> None:
+    n = 10**exp
+    values = list(range(n))
+    print(f'n=10^{exp}, bytes per element')
+    for name, build in CONTAINERS.items():
+        print(f'    {name:<26}{bytes_per_element(build, values):10.1f}')
+
+    print(f'push/pop churn, {n} of each in batches of 1000')
+    for name, make in [('LinkedListStack', LinkedListStack),
+                       ('LinkedListStack + pool', lambda: LinkedListStack(NodePool())),
+                       ('LinkedListQueue', LinkedListQueue),
+                       ('LinkedListQueue + pool', lambda: LinkedListQueue(NodePool()))]:
+        print(f'    {name:<26}{churn(make, n):10.4f}s')
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5)
@@ -0,0 +1,66 @@
+'''
+Compare sorting.sort() against each of the existing sorts.
+
+Run from the repository root:
+    python -m benchmarks.bench_sorting            # n up to 10^5
+    python -m benchmarks.bench_sorting 7          # n up to 10^7 (slow)
+
+The O(n^2) sorts are skipped above QUADRATIC_LIMIT elements.
+'''
+import random
+import sys
+import time
+from typing import Callable, Dict, List
+
+from data_structures import sorting
+
+QUADRATIC_LIMIT = 10**4
+
+SORTS: Dict[str, Callable[[List], None]] = {
+    'sort': sorting.sort,
+    'quick_sort': sorting.quick_sort,
+    'quick_sort_3way': sorting.quick_sort_3way,
+    'merge_sort': sorting.merge_sort,
+    'merge_sort2': sorting.merge_sort2,
+    'heap_sort': sorting.heap_sort,
+    'radix_sort': sorting.radix_sort,
+    'insertion_sort': sorting.insertion_sort,
+    'selection_sort': sorting.selection_sort,
+}
+QUADRATIC = {'insertion_sort', 'selection_sort'}
+
+INPUTS: Dict[str, Callable[[int], List[int]]] = {
+    'random': lambda n: [random.randrange(n) for _ in range(n)],
+    'sorted': lambda n: list(range(n)),
+    'reversed': lambda n: list(range(n, 0, -1)),
+    'two interleaved runs': lambda n: list(range(0, n, 2)) + list(range(1, n, 2)),
+    'sorted + 1% appended': lambda n: list(range(n - n // 100)) + [random.randrange(n) for _ in range(n // 100)],
+    'duplicates': lambda n: [random.randrange(10) for _ in range(n)],
+}
+
+
+def time_sort(f: Callable[[List], None], A: List[int]) -> float:
+    A = A.copy()
+    start = time.perf_counter()
+    try:
+        f(A)
+    except RecursionError:
+        return float('nan')
+    return time.perf_counter() - start
+
+
+def main(max_exp: int = 5) -> None:
+    sys.setrecursionlimit(10**6)
+    for exp in range(3, max_exp + 1):
+        n = 10**exp
+        for input_name, make_input in INPUTS.items():
+            A = make_input(n)
+            print(f'n=10^{exp} {input_name}')
+            for sort_name, f in SORTS.items():
+                if sort_name in QUADRATIC and n > QUADRATIC_LIMIT:
+                    continue
+                print(f'    {sort_name:<16}{time_sort(f, A):10.4f}s')
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5)
@@ -0,0 +1,90 @@
+'''
+Compare building and searching the unbalanced bst.py tree, AVLTree and
+SortedMap on random keys. bst.search_path prints the path it walks, so its
+output goes to a discarding stream and its times include that formatting.
+
+Run from the repository root:
+    python -m benchmarks.bench_trees              # n = 10^6 keys
+    python -m benchmarks.bench_trees 7            # n = 10^7 keys
+'''
+import contextlib
+import io
+import random
+import sys
+import time
+from typing import List
+
+from data_structures.trees import bst
+from data_structures.trees.avl import AVLTree
+from data_structures.trees.sorted_map import SortedMap
+
+# lookups timed per structure, drawn from the inserted keys
+SEARCHES = 100_000
+
+
+class _Discard(io.TextIOBase):
+
+    def write(self, s: str) -> int:
+        return len(s)
+
+
+def timed(label: str, f) -> None:
+    start = time.perf_counter()
+    f()
+    print(f'    {label:<28}{time.perf_counter() - start:10.4f}s')
+
+
+def main(exp: int = 6) -> None:
+    n = 10**exp
+    keys: List[int] = random.sample(range(10 * n), n)
+    probes = random.sample(keys, min(SEARCHES, n))
+    print(f'n=10^{exp}, {len(probes)} searches')
+
+    print('bst')
+    root = None
+
+    def build_bst() -> None:
+        nonlocal root
+        for key in keys:
+            root = bst.insert(root, key)
+
+    def search_bst() -> None:
+        with contextlib.redirect_stdout(_Discard()):
+            for key in probes:
+                bst.search_path(root, key)
+
+    timed('insert', build_bst)
+    timed('search_path', search_bst)
+    root = None
+
+    print('AVLTree')
+    tree = AVLTree()
+
+    def build_avl() -> None:
+        for key in keys:
+            tree.insert(key)
+
+    timed('insert', build_avl)
+    timed('search', lambda: [tree.search(key) for key in probes])
+    tree = None
+
+    print('SortedMap')
+    m = SortedMap()
+
+    def build_map() -> None:
+        for key in keys:
+            m.insert(key)
+
+    timed('insert', build_map)
+    timed('get', lambda: [m.get(key) for key in probes])
+    timed('rank', lambda: [m.rank(key) for key in probes])
+    m = None
+
+    def bulk_load() -> None:
+        SortedMap.from_sorted((key, None) for key in sorted(keys))
+
+    timed('sort + from_sorted', bulk_load)
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 6)
@@ -0,0 +1,172 @@
+import asyncio
+import threading
+from collections import deque
+from typing import Any, Callable, Deque, Iterable, List, Optional
+
+from data_structures.heap import MinHeap
+
+
+# MinHeap that can be shared between threads. One lock guards the array, but
+# it is only held for the sift itself: keys are computed and items wrapped
+# before taking it, and push_many/drain move whole batches under a single
+# acquisition. pop() blocks until an item arrives, optionally with a timeout.
+# Time Complexity:
+    # - insert/pop: O(log(n))
+    # - drain: O(klog(n)) for k items
+class ConcurrentMinHeap(MinHeap):
+
+
+    def __init__(self, *, key: Optional[Callable[[Any], Any]]=None, reverse: bool=False):
+        super().__init__(key=key, reverse=reverse)
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+
+    def insert(self, value) -> None:
+        entry = self._wrap(value)
+        with self._not_empty:
+            self._array.append(entry)
+            self._heapify_up(len(self._array) - 1)
+            self._not_empty.notify()
+
+    def push_many(self, values: Iterable) -> None:
+        entries = [self._wrap(value) for value in values]
+        with self._not_empty:
+            if len(entries) > len(self._array):
+                self._array.extend(entries)
+                self._heapify()
+            else:
+                for entry in entries:
+                    self._array.append(entry)
+                    self._heapify_up(len(self._array) - 1)
+            self._not_empty.notify(len(entries))
+
+    def pop(self, block: bool=True, timeout: Optional[float]=None):
+        '''
+        remove and return the smallest item. If the heap is empty, wait for
+        an insert when block is True, for at most timeout seconds if given.
+        Raises IndexError if nothing arrives.
+        '''
+        with self._not_empty:
+            if block and not self._not_empty.wait_for(lambda: self._array, timeout):
+                raise IndexError('Heap is empty')
+            return super().pop()
+
+    def drain(self, max_items: Optional[int]=None) -> List:
+        '''
+        pop up to max_items (all if None) smallest items, in order, under a
+        single lock acquisition. Never blocks; returns [] if empty.
+        '''
+        with self._lock:
+            n = len(self._array) if max_items is None else min(max_items, len(self._array))
+            return [super(ConcurrentMinHeap, self).pop() for _ in range(n)]
+
+    def pop_many(self, k: int) -> List:
+        return self.drain(k)
+
+    def pushpop(self, value):
+        with self._lock:
+            return super().pushpop(value)
+
+    def replace(self, value):
+        with self._lock:
+            return super().replace(value)
+
+    def peek(self):
+        with self._lock:
+            return super().peek()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._array)
+
+
+# MinHeap for asyncio tasks on one event loop, where await pop() suspends the
+# task until an item is inserted instead of polling. Waiting tasks are woken
+# one per inserted item, in the order they started waiting. Like asyncio.Queue
+# it is not thread safe; producers on other threads should insert through
+# loop.call_soon_threadsafe(heap.insert, item).
+# Time Complexity:
+    # - insert/pop: O(log(n))
+class AsyncMinHeap(MinHeap):
+
+
+    def __init__(self, *, key: Optional[Callable[[Any], Any]]=None, reverse: bool=False):
+        super().__init__(key=key, reverse=reverse)
+        self._getters: Deque[asyncio.Future] = deque()
+
+    def _wakeup_next(self) -> None:
+        while self._getters:
+            getter = self._getters.popleft()
+            if not getter.done():
+                getter.set_result(None)
+                return
+
+    def insert(self, value) -> None:
+        super().insert(value)
+        self._wakeup_next()
+
+    def push_many(self, values: Iterable) -> None:
+        values = list(values)
+        super().push_many(values)
+        for _ in values:
+            self._wakeup_next()
+
+    async def pop(self):
+        '''
+        remove and return the smallest item, waiting for one if the heap is
+        empty. Use asyncio.wait_for(heap.pop(), timeout) for a timeout.
+        '''
+        while self.is_empty():
+            getter = asyncio.get_running_loop().create_future()
+            self._getters.append(getter)
+            try:
+                await getter
+            except BaseException:
+                getter.cancel()
+                try:
+                    self._getters.remove(getter)
+                except ValueError:
+                    pass
+                # pass a wakeup meant for this task on to the next one
+                if not self.is_empty() and not getter.cancelled():
+                    self._wakeup_next()
+                raise
+        return super().pop()
+
+    def pop_nowait(self):
+        return super().pop()
+
+    def drain(self, max_items: Optional[int]=None) -> List:
+        '''
+        pop up to max_items (all if None) smallest items, in order, without waiting
+        '''
+        n = len(self._array) if max_items is None else min(max_items, len(self._array))
+        return [super(AsyncMinHeap, self).pop() for _ in range(n)]
+
+    def pop_many(self, k: int) -> List:
+        return self.drain(k)
+
+
+if __name__ == '__main__':
+
+    h = ConcurrentMinHeap()
+    producers = [threading.Thread(target=h.push_many, args=(range(i, 100, 4),)) for i in range(4)]
+    for t in producers:
+        t.start()
+    for t in producers:
+        t.join()
+    print(h.pop(), h.drain(5), len(h))
+
+    try:
+        ConcurrentMinHeap().pop(timeout=0.01)
+    except IndexError as e:
+        print('timed out:', e)
+
+    async def main() -> None:
+        h = AsyncMinHeap()
+        consumer = asyncio.create_task(h.pop())
+        await asyncio.sleep(0)
+        h.push_many([3, 1, 2])
+        print(await consumer, h.drain())
+
+    asyncio.run(main())
@@ -0,0 +1,276 @@
+import math
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from data_structures.heap import IndexedMinHeap
+
+
+# Tasks scheduled for a deadline, handed back in bulk by poll_expired(now) once
+# the deadline has passed. Kept in an IndexedMinHeap ordered by
+# (deadline, handle), so tasks with the same deadline come back in the order
+# they were scheduled, and cancel() removes the entry outright instead of
+# leaving a dead one in the heap.
+# Time Complexity:
+    # - schedule/cancel: O(log(n))
+    # - poll_expired: O(klog(n)) for k expired tasks
+class DelayQueue:
+
+
+    def __init__(self):
+        self._heap: IndexedMinHeap = IndexedMinHeap()   # handle -> (deadline, handle)
+        self._tasks: Dict[int, Any] = {}
+        self._next_handle: int = 0
+
+    def schedule(self, deadline: float, task) -> int:
+        '''
+        queue task for deadline and return a handle for cancel()
+        '''
+        handle = self._next_handle
+        self._next_handle += 1
+        self._heap.push(handle, (deadline, handle))
+        self._tasks[handle] = task
+        return handle
+
+    def cancel(self, handle: int) -> bool:
+        '''
+        remove a scheduled task; False if it already expired or was cancelled
+        '''
+        if handle not in self._heap:
+            return False
+        self._heap.remove(handle)
+        del self._tasks[handle]
+        return True
+
+    def next_deadline(self) -> Optional[float]:
+        if self._heap.is_empty():
+            return None
+        return self._heap.peek()[1][0]
+
+    def poll_expired(self, now: Optional[float]=None) -> List:
+        '''
+        remove and return all tasks with deadline <= now (time.monotonic()
+        if None), earliest first
+        '''
+        if now is None:
+            now = time.monotonic()
+
+        expired = []
+        while not self._heap.is_empty() and self._heap.peek()[1][0] <= now:
+            handle, _ = self._heap.pop()
+            expired.append(self._tasks.pop(handle))
+        return expired
+
+    def __contains__(self, handle: int) -> bool:
+        return handle in self._heap
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+
+# Hierarchical timing wheel: time is cut into ticks and each of levels wheels
+# has wheel_size slots. A slot on level L spans wheel_size**L ticks, so a timer
+# goes into the lowest level whose wheel covers the time left until it is due.
+# Whenever the clock reaches the start of a higher level slot, its timers are
+# cascaded down into finer slots, until they land in level 0 and expire on
+# their tick. Each slot is a dict keyed by handle, so schedule and cancel are
+# O(1). Timers further out than wheel_size**levels ticks wait in a DelayQueue
+# until they come into range.
+#
+# Deadlines are rounded up to a whole tick: a task never expires early, and at
+# most one tick late; within a tick tasks are not ordered by deadline.
+# Ticks count from start, time.monotonic() at construction by default.
+# poll_expired jumps straight to the next tick with something to expire,
+# cascade or pull in, so idle stretches cost nothing.
+# Time Complexity:
+    # - schedule/cancel: O(1) within range
+    # - poll_expired: O(wheel_size * levels) per tick with work, plus
+    #   O(tasks expired or cascaded)
+class TimingWheel:
+
+
+    def __init__(self, tick: float=0.001, wheel_size: int=256, levels: int=4, start: Optional[float]=None):
+        self._tick: float = tick
+        self._start: float = time.monotonic() if start is None else start
+        self._wheel_size: int = wheel_size
+        self._spans: List[int] = [wheel_size ** level for level in range(levels)]
+        self._horizon: int = wheel_size ** levels
+        self._slots: List[List[Dict[int, Tuple[int, Any]]]] = [
+            [{} for _ in range(wheel_size)] for _ in range(levels)
+        ]
+
+        self._current: int = 0                                    # last tick processed
+        self._ready: Dict[int, Tuple[int, Any]] = {}              # due before the next tick
+        self._overflow: DelayQueue = DelayQueue()                 # handles beyond the horizon, by tick
+        self._overflow_entries: Dict[int, Tuple[int, int, Any]] = {}   # handle -> (overflow handle, tick, task)
+        self._where: Dict[int, Dict] = {}                         # handle -> dict holding it
+        self._in_wheel: int = 0
+        self._next_handle: int = 0
+
+    def _to_tick(self, deadline: float) -> int:
+        return math.ceil((deadline - self._start) / self._tick)
+
+    def _place(self, handle: int, tick: int, task) -> None:
+        '''
+        put a timer due at tick into the wheel relative to the current tick
+        '''
+        delta = tick - self._current
+        for level, span in enumerate(self._spans):
+            if delta < span * self._wheel_size:
+                slot = self._slots[level][(tick // span) % self._wheel_size]
+                slot[handle] = (tick, task)
+                self._where[handle] = slot
+                self._in_wheel += 1
+                return
+
+        overflow_handle = self._overflow.schedule(tick, handle)
+        self._overflow_entries[handle] = (overflow_handle, tick, task)
+        self._where[handle] = self._overflow_entries
+
+    def schedule(self, deadline: float, task) -> int:
+        '''
+        queue task for deadline and return a handle for cancel()
+        '''
+        handle = self._next_handle
+        self._next_handle += 1
+
+        tick = self._to_tick(deadline)
+        if tick <= self._current:
+            self._ready[handle] = (tick, task)
+            self._where[handle] = self._ready
+        else:
+            self._place(handle, tick, task)
+        return handle
+
+    def cancel(self, handle: int) -> bool:
+        '''
+        remove a scheduled task; False if it already expired or was cancelled
+        '''
+        holder = self._where.pop(handle, None)
+        if holder is None:
+            return False
+
+        if holder is self._overflow_entries:
+            overflow_handle, _, _ = holder.pop(handle)
+            self._overflow.cancel(overflow_handle)
+        else:
+            del holder[handle]
+            if holder is not self._ready:
+                self._in_wheel -= 1
+        return True
+
+    def _pull_overflow(self) -> None:
+        '''
+        move timers that have come within the horizon into the wheel
+        '''
+        while True:
+            tick = self._overflow.next_deadline()
+            if tick is None or tick - self._current >= self._horizon:
+                return
+            for handle in self._overflow.poll_expired(tick):
+                _, tick, task = self._overflow_entries.pop(handle)
+                self._place(handle, tick, task)
+
+    def _next_event(self) -> Optional[int]:
+        '''
+        return the first tick after the current one at which a level 0 slot
+        expires, an occupied higher slot cascades or an overflow timer comes
+        within the horizon, or None if the wheel and overflow are empty
+        '''
+        c = self._current
+        W = self._wheel_size
+        best = None
+
+        if self._in_wheel:
+            # level 0 holds timers due within the next W - 1 ticks
+            slots = self._slots[0]
+            for offset in range(1, W):
+                if slots[(c + offset) % W]:
+                    best = c + offset
+                    break
+
+            for level in range(1, len(self._spans)):
+                span = self._spans[level]
+                slots = self._slots[level]
+                boundary = (c // span + 1) * span
+                for _ in range(W):
+                    if best is not None and boundary >= best:
+                        break
+                    if slots[(boundary // span) % W]:
+                        best = boundary
+                        break
+                    boundary += span
+
+        tick = self._overflow.next_deadline()
+        if tick is not None:
+            pull = max(c + 1, tick - self._horizon + 1)
+            if best is None or pull < best:
+                best = pull
+        return best
+
+    def poll_expired(self, now: Optional[float]=None) -> List:
+        '''
+        advance the wheel to now (time.monotonic() if None) and return all
+        tasks that expired, in tick order
+        '''
+        if now is None:
+            now = time.monotonic()
+        target = math.floor((now - self._start) / self._tick)
+
+        # overdue tasks scheduled after the clock passed them, by tick
+        expired = [task for _, task in sorted(self._ready.values(), key=lambda entry: entry[0])]
+        for handle in self._ready:
+            del self._where[handle]
+        self._ready.clear()
+
+        while self._current < target:
+            # skip the ticks where nothing happens
+            c = self._next_event()
+            if c is None or c > target:
+                self._current = target
+                break
+            self._current = c
+
+            # cascade coarser slots starting at this tick, highest level first
+            for level in range(len(self._spans) - 1, 0, -1):
+                span = self._spans[level]
+                if c % span == 0:
+                    index = (c // span) % self._wheel_size
+                    slot = self._slots[level][index]
+                    self._slots[level][index] = {}
+                    self._in_wheel -= len(slot)
+                    for handle, (tick, task) in slot.items():
+                        self._place(handle, tick, task)
+
+            index = c % self._wheel_size
+            slot = self._slots[0][index]
+            if slot:
+                self._slots[0][index] = {}
+                self._in_wheel -= len(slot)
+                for handle, (_, task) in slot.items():
+                    del self._where[handle]
+                    expired.append(task)
+
+            self._pull_overflow()
+
+        return expired
+
+    def __contains__(self, handle: int) -> bool:
+        return handle in self._where
+
+    def __len__(self) -> int:
+        return len(self._where)
+
+
+if __name__ == '__main__':
+
+    for q in (DelayQueue(), TimingWheel(tick=1, wheel_size=4, levels=2, start=0.0)):
+        handles = {name: q.schedule(deadline, name) for name, deadline in
+                   [('a', 5), ('b', 1), ('c', 30), ('d', 3), ('e', 100)]}
+        q.cancel(handles['d'])
+        print(type(q).__name__, q.poll_expired(2), q.poll_expired(40), len(q), q.poll_expired(100))
+
+    wheel = TimingWheel()
+    wheel.schedule(time.monotonic() + 0.01, 'soon')
+    wheel.schedule(time.monotonic() + 3600, 'in an hour')
+    time.sleep(0.02)
+    print(wheel.poll_expired(), len(wheel))
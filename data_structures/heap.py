@@ -1,93 +1,584 @@
-from typing import List
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Protocol, Tuple
+
+
+class Heap(Protocol):
+    '''
+    interface shared by MinHeap, DaryHeap and PairingHeap, so code that
+    only needs a priority queue can be handed any of them
+    '''
+
+    def insert(self, value) -> None: ...
+
+    def pop(self): ...
+
+    def peek(self): ...
+
+    def is_empty(self) -> bool: ...
+
+    def __len__(self) -> int: ...
+
+
+class _Keyed:
+    '''
+    heap entry ordered by a precomputed key instead of by the item itself
+    '''
+    __slots__ = ('priority', 'item')
+
+    def __init__(self, priority, item) -> None:
+        self.priority = priority
+        self.item = item
+
+    def __lt__(self, other: '_Keyed') -> bool:
+        return self.priority < other.priority
+
+
+class _ReverseKeyed(_Keyed):
+    '''
+    heap entry ordered largest key first, turning a min heap into a max heap
+    '''
+    __slots__ = ()
+
+    def __lt__(self, other: '_Keyed') -> bool:
+        return other.priority < self.priority
+
+
+def _entry_functions(key: Optional[Callable[[Any], Any]], reverse: bool) -> Tuple[Callable, Callable]:
+    '''
+    return (wrap, unwrap) converting items to and from what the heap stores.
+    Plain min heaps store items as they are; with key or reverse, items are
+    wrapped with their key, which is computed once on the way in.
+    '''
+    if key is None and not reverse:
+        return _identity, _identity
+
+    entry = _ReverseKeyed if reverse else _Keyed
+    if key is None:
+        return (lambda item: entry(item, item)), _item
+    return (lambda item: entry(key(item), item)), _item
+
+
+def _identity(item):
+    return item
+
+
+def _item(entry: _Keyed):
+    return entry.item
+
 
 # In a Min Binary Heap, the key at root must be minimum among all keys present in Binary Heap. 
 # The same property must be recursively true for all nodes in Binary Tree.
+# The tree is stored level by level in a list holding exactly the items in the heap:
+# the children of index i are at 2i+1 and 2i+2.
+# With key, items are ordered by key(item); with reverse, largest first (a max heap).
 # Time Complexity:
     # - Peek: O(1)
-    # - extract/insert: O(log(n))
+    # - extract/insert/pushpop/replace: O(log(n))
+    # - from_iterable: O(n)
 class MinHeap:
 
 
-    def __init__(self, capacity: int=4):
-        self._capacity: int = capacity
-        self._array: List = [None] * self._capacity
-        self._size: int = 0
+    def __init__(self, *, key: Optional[Callable[[Any], Any]]=None, reverse: bool=False):
+        self._array: List = []
+        self._wrap, self._unwrap = _entry_functions(key, reverse)
+
+    @classmethod
+    def from_iterable(cls, iterable: Iterable, **kwargs) -> 'MinHeap':
+        '''
+        build a heap from all items at once in O(n) (Floyd's method).
+        kwargs are passed on to the constructor.
+        '''
+        heap = cls(**kwargs)
+        heap._array = [heap._wrap(value) for value in iterable]
+        heap._heapify()
+        return heap
 
     def is_empty(self) -> bool:
-        return self._size == 0
+        return not self._array
 
-    def _grow_heap(self) -> None:
-        print('growing!')
-        self._capacity *= 2
-        temp = [None] * self._capacity
-        temp[:self._size] = self._array[:self._size]
-        self._array = temp
+    def _heapify(self) -> None:
+        '''
+        sift down every parent from the last one up to the root. Most nodes
+        are near the bottom and only move a level or two, so this is O(n).
+        '''
+        for i in range(len(self._array) // 2 - 1, -1, -1):
+            self._heapify_down(i)
 
+    def _heapify_up(self, child_index: int) -> None:
+        '''
+        move the item at child_index up until its parent is not larger,
+        shifting parents down into the hole instead of swapping
+        '''
+        array = self._array
+        value = array[child_index]
 
-    def _swap(self, i: int, j: int) -> None:
-        self._array[i], self._array[j] = self._array[j], self._array[i]
+        while child_index > 0:
+            parent_index = (child_index - 1) // 2
+            parent = array[parent_index]
+            if not value < parent:
+                break
+            array[child_index] = parent
+            child_index = parent_index
 
+        array[child_index] = value
 
-    def _heapify_up(self, child_index: int) -> None:
-        parent_index = (child_index - 1) // 2
+    def _heapify_down(self, parent_index: int=0) -> None:
+        '''
+        move the item at parent_index down until no child is smaller,
+        shifting the smaller child up into the hole instead of swapping
+        '''
+        array = self._array
+        size = len(array)
+        value = array[parent_index]
+
+        child_index = 2 * parent_index + 1
+        while child_index < size:
+            # pick the smaller child
+            right_child_index = child_index + 1
+            if right_child_index < size and array[right_child_index] < array[child_index]:
+                child_index = right_child_index
+
+            if not array[child_index] < value:
+                break
+            array[parent_index] = array[child_index]
+            parent_index = child_index
+            child_index = 2 * parent_index + 1
 
-        # if heap propery is violated swap
-        if parent_index >= 0 and self._array[parent_index] > self._array[child_index]:
-            self._swap(parent_index, child_index)
-            self._heapify_up(parent_index)
+        array[parent_index] = value
 
-    def _min_child_index(self, left_child_index: int, right_child_index: int) -> None:
-        if self._array[right_child_index] is None:   # right child empty
-            return left_child_index
+    def insert(self, value) -> None:
+        # insert element at end of heap
+        self._array.append(self._wrap(value))
+        self._heapify_up(len(self._array) - 1)
+
+    def push_many(self, values: Iterable) -> None:
+        '''
+        insert all values; when they outnumber the items already in the
+        heap, appending them all and rebuilding in O(n) beats n inserts
+        '''
+        entries = [self._wrap(value) for value in values]
+        if len(entries) > len(self._array):
+            self._array.extend(entries)
+            self._heapify()
         else:
-            return left_child_index if self._array[left_child_index] < self._array[right_child_index] else right_child_index
+            for entry in entries:
+                self._array.append(entry)
+                self._heapify_up(len(self._array) - 1)
+
+    def pop(self):
+        if self.is_empty():
+            raise IndexError('Heap is empty')
+
+        # move last value to the root
+        last = self._array.pop()
+        if not self._array:
+            return self._unwrap(last)
+
+        value = self._array[0]
+        self._array[0] = last
+        self._heapify_down()
+
+        return self._unwrap(value)
+
+    def pop_many(self, k: int) -> List:
+        '''
+        pop up to k smallest values, in order
+        '''
+        return [self.pop() for _ in range(min(k, len(self._array)))]
+
+    def pushpop(self, value):
+        '''
+        insert value then pop the smallest, in a single sift down. If value
+        is not larger than the root it comes straight back untouched.
+        '''
+        entry = self._wrap(value)
+        if not self._array or not self._array[0] < entry:
+            return value
+
+        smallest = self._array[0]
+        self._array[0] = entry
+        self._heapify_down()
+        return self._unwrap(smallest)
+
+    def replace(self, value):
+        '''
+        pop the smallest then insert value, in a single sift down.
+        The returned value may be smaller than value.
+        '''
+        if self.is_empty():
+            raise IndexError('Heap is empty')
+
+        smallest = self._array[0]
+        self._array[0] = self._wrap(value)
+        self._heapify_down()
+        return self._unwrap(smallest)
+
+    def __len__(self) -> int:
+        return len(self._array)
+
+    def __repr__(self) -> str:
+        return str([self._unwrap(entry) for entry in self._array])
+
+    def peek(self):
+        if self.is_empty():
+            raise IndexError('Heap is empty')
+        return self._unwrap(self._array[0])
+
+
+# Same as MinHeap, but every node has d children instead of 2: the children
+# of index i are at d*i+1 .. d*i+d. The tree is only log_d(n) deep, so inserts
+# move fewer levels, while each level of a pop compares d children, which
+# sit next to each other in the list.
+# Time Complexity:
+    # - insert: O(log_d(n))
+    # - extract: O(d*log_d(n))
+class DaryHeap(MinHeap):
+
+
+    def __init__(self, d: int=4, *, key: Optional[Callable[[Any], Any]]=None, reverse: bool=False):
+        if d < 2:
+            raise ValueError('d must be at least 2')
+        super().__init__(key=key, reverse=reverse)
+        self._d: int = d
+
+    def _heapify(self) -> None:
+        for i in range((len(self._array) - 2) // self._d, -1, -1):
+            self._heapify_down(i)
+
+    def _heapify_up(self, child_index: int) -> None:
+        array = self._array
+        d = self._d
+        value = array[child_index]
+
+        while child_index > 0:
+            parent_index = (child_index - 1) // d
+            parent = array[parent_index]
+            if not value < parent:
+                break
+            array[child_index] = parent
+            child_index = parent_index
+
+        array[child_index] = value
 
     def _heapify_down(self, parent_index: int=0) -> None:
-        left_child_index = parent_index * 2 + 1
-        right_child_index = left_child_index + 1
-        if left_child_index > self._capacity or (self._array[left_child_index] is None and self._array[right_child_index] is None): # leaf 
-            return
-        else:
-            min_child_index = self._min_child_index(left_child_index, right_child_index)
-            if self._array[parent_index] > self._array[min_child_index]:
-                # swap
-                self._swap(parent_index, min_child_index)
-                self._heapify_down(min_child_index)
+        array = self._array
+        d = self._d
+        size = len(array)
+        value = array[parent_index]
 
+        first_child_index = d * parent_index + 1
+        while first_child_index < size:
+            # pick the smallest of up to d children
+            child_index = first_child_index
+            for i in range(first_child_index + 1, min(first_child_index + d, size)):
+                if array[i] < array[child_index]:
+                    child_index = i
 
-    def insert(self, value) -> None:
-        if self._size == self._capacity:
-            self._grow_heap()
+            if not array[child_index] < value:
+                break
+            array[parent_index] = array[child_index]
+            parent_index = child_index
+            first_child_index = d * parent_index + 1
 
-        # insert element at end of heap
-        self._array[self._size] = value 
+        array[parent_index] = value
+
+
+class _PairingNode:
+    __slots__ = ('value', 'child', 'sibling')
+
+    def __init__(self, value) -> None:
+        self.value = value
+        self.child: Optional['_PairingNode'] = None     # leftmost child
+        self.sibling: Optional['_PairingNode'] = None   # next child of the same parent
+
+
+def _link(a: _PairingNode, b: _PairingNode) -> _PairingNode:
+    '''
+    make the root with the larger value the leftmost child of the other
+    '''
+    if b.value < a.value:
+        a, b = b, a
+    b.sibling = a.child
+    a.child = b
+    return a
 
-        if self._size > 0:
-            self._heapify_up(self._size)
+
+# A heap-ordered tree where each node keeps any number of children. insert
+# and meld just link two roots; pop removes the root and pairs up its
+# children left to right, then links the pairs right to left (two-pass).
+# Time Complexity:
+    # - Peek/insert/meld: O(1)
+    # - extract: O(log(n)) amortized
+class PairingHeap:
+
+
+    def __init__(self, *, key: Optional[Callable[[Any], Any]]=None, reverse: bool=False):
+        self._root: Optional[_PairingNode] = None
+        self._size: int = 0
+        self._key = key
+        self._reverse: bool = reverse
+        self._wrap, self._unwrap = _entry_functions(key, reverse)
+
+    def is_empty(self) -> bool:
+        return self._root is None
+
+    def insert(self, value) -> None:
+        node = _PairingNode(self._wrap(value))
+        self._root = node if self._root is None else _link(self._root, node)
         self._size += 1
 
+    def push_many(self, values: Iterable) -> None:
+        for value in values:
+            self.insert(value)
+
+    def meld(self, other: 'PairingHeap') -> None:
+        '''
+        move all items of other into this heap in O(1), leaving other empty
+        '''
+        if other._key is not self._key or other._reverse != self._reverse:
+            raise ValueError('can only meld heaps with the same key and order')
+        if other._root is not None:
+            self._root = other._root if self._root is None else _link(self._root, other._root)
+            self._size += other._size
+        other._root, other._size = None, 0
 
     def pop(self):
         if self.is_empty():
             raise IndexError('Heap is empty')
 
-        value = self._array[0]
-
-        # swap with last value
+        root = self._root
         self._size -= 1
-        self._array[0], self._array[self._size] = self._array[self._size], None
-        
-        self._heapify_down()
 
-        return value
+        # first pass: link children in pairs, left to right
+        pairs = []
+        node = root.child
+        while node is not None:
+            first, second = node, node.sibling
+            if second is None:
+                node = None
+                first.sibling = None
+                pairs.append(first)
+            else:
+                node = second.sibling
+                first.sibling = second.sibling = None
+                pairs.append(_link(first, second))
+
+        # second pass: link the pairs into one tree, right to left
+        new_root = pairs.pop() if pairs else None
+        while pairs:
+            new_root = _link(pairs.pop(), new_root)
+        self._root = new_root
+
+        return self._unwrap(root.value)
+
+    def pop_many(self, k: int) -> List:
+        return [self.pop() for _ in range(min(k, self._size))]
+
+    def peek(self):
+        if self.is_empty():
+            raise IndexError('Heap is empty')
+        return self._unwrap(self._root.value)
+
+    def __len__(self) -> int:
+        return self._size
+
+# Min heap of keys ordered by a separate priority, with a map from each key to
+# its position in the heap so a queued key can be found, reprioritized or
+# removed without pushing duplicates. Keys must be hashable and unique; only
+# priorities are compared.
+# Time Complexity:
+    # - Peek/contains/priority: O(1)
+    # - push/pop/decrease_key/increase_key/remove: O(log(n))
+class IndexedMinHeap:
+
+
+    def __init__(self):
+        self._keys: List[Hashable] = []
+        self._priorities: List = []
+        self._index: Dict[Hashable, int] = {}   # key -> position in _keys
+
+    def is_empty(self) -> bool:
+        return not self._keys
+
+    def _heapify_up(self, child_index: int) -> None:
+        keys, priorities, index = self._keys, self._priorities, self._index
+        key, priority = keys[child_index], priorities[child_index]
+
+        while child_index > 0:
+            parent_index = (child_index - 1) // 2
+            if not priority < priorities[parent_index]:
+                break
+            keys[child_index] = keys[parent_index]
+            priorities[child_index] = priorities[parent_index]
+            index[keys[child_index]] = child_index
+            child_index = parent_index
+
+        keys[child_index], priorities[child_index] = key, priority
+        index[key] = child_index
+
+    def _heapify_down(self, parent_index: int=0) -> None:
+        keys, priorities, index = self._keys, self._priorities, self._index
+        size = len(keys)
+        key, priority = keys[parent_index], priorities[parent_index]
+
+        child_index = 2 * parent_index + 1
+        while child_index < size:
+            right_child_index = child_index + 1
+            if right_child_index < size and priorities[right_child_index] < priorities[child_index]:
+                child_index = right_child_index
+
+            if not priorities[child_index] < priority:
+                break
+            keys[parent_index] = keys[child_index]
+            priorities[parent_index] = priorities[child_index]
+            index[keys[parent_index]] = parent_index
+            parent_index = child_index
+            child_index = 2 * parent_index + 1
+
+        keys[parent_index], priorities[parent_index] = key, priority
+        index[key] = parent_index
+
+    def push(self, key: Hashable, priority) -> None:
+        if key in self._index:
+            raise KeyError(f'{key!r} is already in the heap')
+
+        self._keys.append(key)
+        self._priorities.append(priority)
+        self._heapify_up(len(self._keys) - 1)
+
+    def _remove_at(self, i: int) -> Tuple[Hashable, Any]:
+        '''
+        remove the entry at position i by moving the last entry into its place
+        '''
+        key, priority = self._keys[i], self._priorities[i]
+        del self._index[key]
+
+        last_key, last_priority = self._keys.pop(), self._priorities.pop()
+        if i < len(self._keys):
+            self._keys[i], self._priorities[i] = last_key, last_priority
+            self._index[last_key] = i
+            if i > 0 and last_priority < self._priorities[(i - 1) // 2]:
+                self._heapify_up(i)
+            else:
+                self._heapify_down(i)
+
+        return key, priority
+
+    def pop(self) -> Tuple[Hashable, Any]:
+        '''
+        remove and return (key, priority) with the smallest priority
+        '''
+        if self.is_empty():
+            raise IndexError('Heap is empty')
+        return self._remove_at(0)
+
+    def peek(self) -> Tuple[Hashable, Any]:
+        if self.is_empty():
+            raise IndexError('Heap is empty')
+        return self._keys[0], self._priorities[0]
+
+    def remove(self, key: Hashable):
+        '''
+        remove key from the heap and return its priority
+        '''
+        return self._remove_at(self._index[key])[1]
+
+    def priority(self, key: Hashable):
+        return self._priorities[self._index[key]]
+
+    def decrease_key(self, key: Hashable, priority) -> None:
+        '''
+        lower the priority of key, which moves it towards the root
+        '''
+        i = self._index[key]
+        if self._priorities[i] < priority:
+            raise ValueError('new priority is larger than the current one')
+        self._priorities[i] = priority
+        self._heapify_up(i)
+
+    def increase_key(self, key: Hashable, priority) -> None:
+        '''
+        raise the priority of key, which moves it away from the root
+        '''
+        i = self._index[key]
+        if priority < self._priorities[i]:
+            raise ValueError('new priority is smaller than the current one')
+        self._priorities[i] = priority
+        self._heapify_down(i)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._index
+
+    def __len__(self) -> int:
+        return len(self._keys)
 
     def __repr__(self) -> str:
-        return str(self._array)
+        return str(list(zip(self._keys, self._priorities)))
+
+
+class _Reversed:
+    '''
+    wraps a key so it orders the other way round, letting a MinHeap
+    keep its largest key at the root
+    '''
+    __slots__ = ('value',)
+
+    def __init__(self, value) -> None:
+        self.value = value
+
+    def __lt__(self, other: '_Reversed') -> bool:
+        return other.value < self.value
+
+    def __eq__(self, other: '_Reversed') -> bool:
+        return self.value == other.value
+
+
+# Keeps the k largest (or smallest) items of a stream using O(k) memory.
+# The root of the MinHeap is the weakest item kept so far; a new item only
+# gets in if it beats the root, which it then replaces.
+# Time Complexity:
+    # - push: O(log(k))
+    # - result: O(klog(k))
+class TopK:
+
+
+    def __init__(self, k: int, key: Optional[Callable[[Any], Any]]=None, largest: bool=True):
+        self._k: int = k
+        self._key = key
+        self._largest: bool = largest
+        self._heap: MinHeap = MinHeap()
+        self._count: int = 0   # items pushed so far, to prefer earlier ones on ties
+
+    def push(self, item) -> None:
+        if self._k <= 0:
+            return
+
+        key = item if self._key is None else self._key(item)
+        if not self._largest:
+            key = _Reversed(key)
+        # a later item ties below an earlier one, so it never evicts it
+        entry = (key, -self._count, item)
+        self._count += 1
+
+        if len(self._heap) < self._k:
+            self._heap.insert(entry)
+        elif self._heap.peek() < entry:
+            self._heap.replace(entry)
+
+    def extend(self, iterable: Iterable) -> None:
+        for item in iterable:
+            self.push(item)
+
+    def result(self) -> List:
+        '''
+        items kept so far, best first
+        '''
+        entries = sorted(self._heap._array, reverse=True)
+        return [item for _, _, item in entries]
+
+    def __len__(self) -> int:
+        return len(self._heap)
 
-    def peek(self) -> int:
-        return self._array[0]
 
-    
 if __name__ == '__main__':
     h = MinHeap()
     print(h)
@@ -106,4 +597,24 @@ if __name__ == '__main__':
     h.insert(6)
     print(h)
     print(h.peek())
-    print(h)
\ No newline at end of file
+    print(h)
+
+    h = MinHeap.from_iterable([9, 4, 7, 1, 8, 2])
+    print(h)
+    print(h.pushpop(3))
+    print(h.pop_many(3))
+
+    for h in (MinHeap(reverse=True), DaryHeap(d=4), PairingHeap(key=lambda x: -x)):
+        h.push_many([5, 1, 9, 3, 7])
+        print(type(h).__name__, h.pop_many(5))
+
+    h = IndexedMinHeap()
+    for key, priority in [('a', 5), ('b', 3), ('c', 8), ('d', 1)]:
+        h.push(key, priority)
+    h.decrease_key('c', 0)
+    h.remove('b')
+    print(h.pop(), h.pop(), h.pop())
+
+    top = TopK(3)
+    top.extend([5, 1, 9, 3, 7, 9, 2])
+    print(top.result())
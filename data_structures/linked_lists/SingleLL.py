@@ -1,6 +1,8 @@
 # single linked node
 
 class Node: 
+    __slots__ = ('data', 'next')
+
     def __init__(self, data): 
         self.data = data 
         self.next = None
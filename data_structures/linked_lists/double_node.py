@@ -1,4 +1,6 @@
 class Node: 
+    __slots__ = ('data', 'next', 'prev')
+
     def __init__(self, data=None, next=None, prev=None): 
         self.data = data 
         self.next = next
@@ -1,10 +1,52 @@
 # single linked node
 
+from typing import List, Optional
+
+
 class Node: 
+    __slots__ = ('data', 'next')
+
     def __init__(self, data, next=None): 
         self.data = data 
         self.next = next
 
+
+# Free list of Nodes for structures that push and pop constantly, such as
+# LinkedListStack and LinkedListQueue. Popped nodes are handed back with
+# release() and reused by acquire() instead of being freed and allocated
+# again. At most max_size spare nodes are kept, so a burst does not pin its
+# peak memory forever.
+# Time Complexity:
+    # - acquire/release: O(1)
+class NodePool:
+
+
+    def __init__(self, max_size: int=1024) -> None:
+        self._free: List[Node] = []
+        self._max_size: int = max_size
+
+    def acquire(self, data, next: Optional[Node]=None) -> Node:
+        '''
+        return a node holding data, reused if one is free
+        '''
+        if self._free:
+            node = self._free.pop()
+            node.data = data
+            node.next = next
+            return node
+        return Node(data, next)
+
+    def release(self, node: Node) -> None:
+        '''
+        take back a node nothing refers to anymore
+        '''
+        if len(self._free) < self._max_size:
+            node.data = node.next = None   # drop references held by the node
+            self._free.append(node)
+
+    def __len__(self) -> int:
+        return len(self._free)
+
 # UTILITY FUNCTIONS 
 # Function to insert a node at the 
 # beginning of the linked list 
@@ -1,10 +1,13 @@
-from data_structures.linked_lists.node import Node
+from typing import Optional
+
+from data_structures.linked_lists.single_node import Node, NodePool
 
 class LinkedListQueue:
 
-    def __init__(self):
+    def __init__(self, pool: Optional[NodePool]=None):
         
         self.head, self.tail = None, None
+        self._pool = pool    # reuse popped nodes if given
 
 
     def is_empty(self):
@@ -19,7 +22,7 @@ class LinkedListQueue:
 
 
     def push(self, value):
-        t = Node(value)
+        t = Node(value) if self._pool is None else self._pool.acquire(value)
         if self.tail is not None:
             self.tail.next = t; 
 
@@ -32,12 +35,16 @@ class LinkedListQueue:
         if self.is_empty():
             raise ValueError('Queue is empty')
 
-        value = self.head.data
+        node = self.head
+        value = node.data
 
-        self.head = self.head.next
+        self.head = node.next
 
         if self.head is None:
-            self.last = None
+            self.tail = None
+
+        if self._pool is not None:
+            self._pool.release(node)
         
         return value
  
@@ -82,4 +89,15 @@ if __name__ == '__main__':
     assert result == ans, f'Error: is_empty() should return {ans} but returned {result}'
 
     # should throw ValueError
-    # q.pop()
\ No newline at end of file
+    # q.pop()
+
+    # same again, recycling nodes through a pool
+    pool = NodePool()
+    q = LinkedListQueue(pool)
+    for i in values:
+        q.push(i)
+    result = [q.pop() for _ in values]
+    assert result == values, f'Error: pop() should return {values} but returned {result}'
+    q.push(1)
+    q.push(2)
+    assert len(pool) == len(values) - 2 and [i for i in q] == [1, 2]
\ No newline at end of file
@@ -1,7 +1,111 @@
+import bisect
+import heapq
+import math
+import os
+import pickle
 import random
-from typing import List
+import tempfile
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import IO, Any, Callable, Iterable, Iterator, List, Optional, Tuple
 
-def selection_sort(A: List[int]) -> None:
+from data_structures.heap import MinHeap, TopK
+
+try:
+    import numpy as np
+except ImportError:   # numpy is optional, everything has a pure Python path
+    np = None
+
+# lists at least this long are handed to numpy when it is installed
+NUMPY_THRESHOLD = 10_000
+
+# bits per digit for radix sort, i.e. 256 buckets per pass
+RADIX_BITS = 8
+
+# items per pickled block in the run files of external_sort
+EXTERNAL_BLOCK_SIZE = 1024
+
+# lists shorter than this are not worth starting worker processes for
+PARALLEL_THRESHOLD = 100_000
+
+
+def _numpy_array(A):
+    '''
+    return A as a numpy array if the numpy backend should handle it, else None.
+    Lists qualify when they are long enough and hold only ints (that fit in
+    int64) or only floats, so converting back gives identical values.
+    '''
+    if np is None:
+        return None
+    if isinstance(A, np.ndarray):
+        return A
+    if not isinstance(A, list) or len(A) < NUMPY_THRESHOLD:
+        return None
+
+    t = type(A[0])
+    if t not in (int, float) or not all(type(x) is t for x in A):
+        return None
+    arr = np.asarray(A)
+    # ints outside int64 become objects, or floats if mixed with negatives
+    if arr.dtype.kind != ('i' if t is int else 'f'):
+        return None
+    return arr
+
+
+def _write_back(A, sorted_arr) -> None:
+    '''
+    store a sorted numpy array back into A in place
+    '''
+    if isinstance(A, list):
+        A[:] = sorted_arr.tolist()
+    else:
+        A[...] = sorted_arr
+
+
+def _sort_by_key(f: Callable[[List], None], A: List, key: Optional[Callable[[Any], Any]], reverse: bool) -> None:
+    '''
+    sort A in place with the plain sort f, ordering by key(x) (or x itself)
+    and descending if reverse.
+
+    key is called exactly once per element. Each key is paired with the
+    index of its value, f sorts the (key, index) pairs, and the values are
+    then put in the order of the indices. Since indices are unique, values
+    are never compared and ties on the key keep their original order, so
+    the result is stable whether or not f is. When reversing, indices are
+    negated and the sorted pairs reversed, which keeps ties in original order.
+    '''
+    sign = -1 if reverse else 1
+    if key is None:
+        decorated = [(x, sign*i) for i, x in enumerate(A)]
+    else:
+        decorated = [(key(x), sign*i) for i, x in enumerate(A)]
+
+    f(decorated)
+    if reverse:
+        decorated.reverse()
+    A[:] = [A[sign*i] for _, i in decorated]
+
+
+def _stable_reversible(f: Callable[[List, List], None], A: List, key: Optional[Callable[[Any], Any]], reverse: bool) -> None:
+    '''
+    run the stable sort f(keys, A) of A by the parallel list of key(x) (or
+    x itself). For reverse, sort the reversed input and reverse the result:
+    descending keys with ties still in original order. numpy arrays are
+    sorted as a list of Python scalars and written back.
+    '''
+    items = A if isinstance(A, list) else A.tolist()
+    if reverse:
+        items = items[::-1]
+    keys = items.copy() if key is None else [key(x) for x in items]
+    f(keys, items)
+    if reverse:
+        items.reverse()
+    if items is not A:
+        A[:] = items
+
+
+def selection_sort(A: List[int], key: Optional[Callable[[Any], Any]]=None, reverse: bool=False) -> None:
     ''' 
     The selection sort algorithm sorts an array by repeatedly 
     finding the minimum element (considering ascending order) 
@@ -15,6 +119,10 @@ def selection_sort(A: List[int]) -> None:
         - Repeat until the array is sorted.
     O(n^2) time and O(1) space complexity
     '''
+    if key is not None or reverse:
+        _sort_by_key(selection_sort, A, key, reverse)
+        return
+
     for i in range(len(A)):
 
         # find next smallest value
@@ -27,7 +135,7 @@ def selection_sort(A: List[int]) -> None:
         A[i], A[min_index] = A[min_index], A[i]
 
 
-def insertion_sort(A: List[int]) -> None:
+def insertion_sort(A: List[int], key: Optional[Callable[[Any], Any]]=None, reverse: bool=False) -> None:
     '''
     Insertion sort is a simple sorting algorithm that works similar to the 
     way you sort playing cards in your hands. The array is virtually split 
@@ -48,6 +156,10 @@ def insertion_sort(A: List[int]) -> None:
 
     O(n^2) time and O(1) space complexity
     '''
+    if key is not None or reverse:
+        _sort_by_key(insertion_sort, A, key, reverse)
+        return
+
     for i in range(1, len(A)):
 
         key = A[i]
@@ -63,7 +175,24 @@ def insertion_sort(A: List[int]) -> None:
         A[j+1] = key
 
 
-def merge_sort(A: List[int]) -> None:
+# below this many elements insertion sort beats partitioning or merging
+INSERTION_SORT_CUTOFF = 16
+
+
+def _insertion_sort_range(A: List, lo: int, hi: int) -> None:
+    '''
+    insertion sort of A[lo..hi] inclusive
+    '''
+    for i in range(lo + 1, hi + 1):
+        key = A[i]
+        j = i - 1
+        while j >= lo and A[j] > key:
+            A[j+1] = A[j]
+            j -= 1
+        A[j+1] = key
+
+
+def merge_sort(A: List[int], key: Optional[Callable[[Any], Any]]=None, reverse: bool=False) -> None:
     ''' 
     The Merge Sort algorithm is a sorting algorithm that is based on the Divide and Conquer paradigm. 
     In this algorithm, the array is initially divided into two equal halves and then they are combined in a sorted manner.
@@ -75,90 +204,157 @@ def merge_sort(A: List[int]) -> None:
     of taking two smaller sorted arrays and combining them to eventually make a larger one.
 
     O(nlog(n)) time and O(n) space complexity and a stable sort
+
+    If numpy is installed, numpy arrays and long numeric lists are sorted with
+    numpy's stable sort instead.
     '''
-    if len(A) > 1:   # so dont infinitely recurse
-        # split into two halves
-        mid = len(A) // 2 
-        left, right = A[:mid], A[mid:]
+    if key is not None or reverse:
+        _sort_by_key(merge_sort, A, key, reverse)
+        return
+
+    arr = _numpy_array(A)
+    if arr is not None:
+        _write_back(A, np.sort(arr, kind='stable'))
+        return
+
+    def sort(A: List[int]) -> None:
+        if len(A) > 1:   # so dont infinitely recurse
+            # split into two halves
+            mid = len(A) // 2 
+            left, right = A[:mid], A[mid:]
         
-        # sort each half
-        merge_sort(left)
-        merge_sort(right)
-
-        i = j = k = 0
-        # Copy data to temp arrays left[] and right[]
-        while i < len(left) and j < len(right):
-            if left[i] < right[j]:
+            # sort each half
+            sort(left)
+            sort(right)
+
+            i = j = k = 0
+            # Copy data to temp arrays left[] and right[]
+            while i < len(left) and j < len(right):
+                if left[i] < right[j]:
+                    A[k] = left[i]
+                    i += 1
+                else:
+                    A[k] = right[j]
+                    j += 1
+                k += 1
+
+            # Checking if any element was left
+            while i < len(left):
                 A[k] = left[i]
                 i += 1
-            else:
+                k += 1
+
+            while j < len(right):
                 A[k] = right[j]
                 j += 1
-            k += 1
+                k += 1
 
-        # Checking if any element was left
-        while i < len(left):
-            A[k] = left[i]
-            i += 1
-            k += 1
+    sort(A)
+
+
+def _merge(src: List, dst: List, lo: int, mid: int, hi: int) -> None:
+    '''
+    merge sorted src[lo..mid] and src[mid+1..hi] into dst[lo..hi]
+    '''
+    i, j = lo, mid + 1
 
-        while j < len(right):
-            A[k] = right[j]
+    k = lo 
+    while i <= mid and j <= hi:
+        if src[j] < src[i]:   # take from left on ties to stay stable
+            dst[k] = src[j]
             j += 1
-            k += 1
+        else:
+            dst[k] = src[i]
+            i += 1
+        k += 1
 
+    # copy whichever half is left over
+    if i <= mid:
+        dst[k:hi+1] = src[i:mid+1]
+    else:
+        dst[k:hi+1] = src[j:hi+1]
 
-def merge_sort2(A: List[int], bottom_up: bool=False) -> None:
 
-    def merge(lo: int, mid: int, hi: int) -> None:
-        i, j = lo, mid + 1
+def merge_sort2(A: List[int], bottom_up: bool=False, buffer: Optional[List]=None,
+                key: Optional[Callable[[Any], Any]]=None, reverse: bool=False) -> None:
+    '''
+    Merge sort using one auxiliary array for the whole sort instead of
+    copying on every merge.
 
-        # copy A into aux
-        aux = A.copy() 
+    Top-down, A and aux start as identical copies and each level of recursion
+    swaps their roles, merging from one into the other, so no element is
+    copied back between levels. Bottom-up, each pass merges runs of width sz
+    from one array into the other. In both cases a merge is skipped (a plain
+    slice copy) when the two halves are already in order, and small
+    subarrays are handled by insertion sort.
 
-        k = lo 
-        while k <= hi:
-            if i > mid:           # exhausted first half of array
-                A[k] = aux[j]
-                j += 1
-            elif j > hi:          # exhausted second half of array
-                A[k] = aux[i]
-                i += 1
-            elif aux[i] < aux[j]:
-                A[k] = aux[i]
-                i += 1
-            else:
-                A[k] = aux[j]
-                j += 1
-            k += 1
+    buffer can be passed to reuse the same scratch list across calls. It is
+    grown in place if it is shorter than A and its contents are overwritten.
 
-    def sort(lo: int, hi: int) -> None:
-        if hi <= lo:
+    O(nlog(n)) time and O(n) space complexity and a stable sort
+    '''
+    if key is not None or reverse:
+        _sort_by_key(lambda B: merge_sort2(B, bottom_up, buffer), A, key, reverse)
+        return
+
+    N = len(A)
+    if N < 2:
+        return
+
+    if buffer is None:
+        aux = A.copy()
+    else:
+        aux = buffer
+        aux[:N] = A    # grows buffer in place if it is too short
+
+    def sort(src: List, dst: List, lo: int, hi: int) -> None:
+        '''
+        sort src[lo..hi] into dst[lo..hi]; both hold the same values on entry
+        '''
+        if hi - lo < INSERTION_SORT_CUTOFF:
+            _insertion_sort_range(dst, lo, hi)
             return
 
         mid = lo + (hi - lo) // 2
-        sort(lo, mid)
-        sort(mid+1, hi)
-        merge(lo, mid, hi)
+        sort(dst, src, lo, mid)
+        sort(dst, src, mid+1, hi)
+
+        if not src[mid+1] < src[mid]:   # halves already in order
+            dst[lo:hi+1] = src[lo:hi+1]
+        else:
+            _merge(src, dst, lo, mid, hi)
 
     def sort_bottom_up() -> None:
-        N = len(A)
+        # sort small blocks in place first, then merge widths of sz
+        sz = INSERTION_SORT_CUTOFF
+        for lo in range(0, N, sz):
+            _insertion_sort_range(A, lo, min(lo + sz, N) - 1)
 
-        sz = 1
+        src, dst = A, aux
         while sz < N:
             lo = 0
             while lo < N - sz:
-                merge(lo, lo+sz-1, min([lo + sz + sz-1, N-1]))
-                lo += sz+sz
+                mid, hi = lo + sz - 1, min(lo + sz + sz - 1, N - 1)
+                if not src[mid+1] < src[mid]:
+                    dst[lo:hi+1] = src[lo:hi+1]
+                else:
+                    _merge(src, dst, lo, mid, hi)
+                lo += sz + sz
+            # carry the unpaired tail run over to dst
+            dst[lo:N] = src[lo:N]
+            src, dst = dst, src
             sz = sz+sz
 
+        if src is not A:
+            A[:] = src[:N]
+
     if bottom_up:
         sort_bottom_up() 
     else: 
-        sort(0, len(A)-1)
+        sort(aux, A, 0, N-1)
 
 
-def partition(A: List[int], lo: int, hi: int) -> None:
+def partition(A: List[int], lo: int, hi: int) -> int:
     i = lo + 1
     j = hi 
     pivot_value = A[lo]
@@ -180,8 +376,11 @@ def partition(A: List[int], lo: int, hi: int) -> None:
         if i >= j:
             break 
 
-        # swap i and j
+        # swap i and j, then step past them so runs of
+        # keys equal to the pivot cannot stall the scan
         A[i], A[j] = A[j], A[i]
+        i += 1
+        j -= 1
 
     # swap partitioning item
     A[lo], A[j] = A[j], A[lo]
@@ -191,28 +390,68 @@ def partition(A: List[int], lo: int, hi: int) -> None:
     
 
 
-def quick_sort(A: List[int]) -> None:
-
-    def sort(lo: int, hi: int) -> None:
-        if lo >= hi:
-            return
-        k = partition(A, lo, hi)
-        sort(lo, k-1)
-        sort(k+1, hi)
+def quick_sort(A: List[int], key: Optional[Callable[[Any], Any]]=None, reverse: bool=False) -> None:
+    ''' 
+    iterative: the larger side of each partition is pushed on an explicit
+    stack and the smaller side is partitioned next, so the stack never
+    holds more than O(log(n)) ranges
+    '''
+    if key is not None or reverse:
+        _sort_by_key(quick_sort, A, key, reverse)
+        return
 
     random.shuffle(A)
-    sort(0, len(A)-1)
+
+    stack = [(0, len(A)-1)]
+    while stack:
+        lo, hi = stack.pop()
+        while lo < hi:
+            k = partition(A, lo, hi)
+            if k - lo < hi - k:
+                stack.append((k+1, hi))
+                hi = k - 1
+            else:
+                stack.append((lo, k-1))
+                lo = k + 1
 
 
-def quick_select(A: List[int], k: int) -> int:
+def quick_select(A: List[int], k: int, key: Optional[Callable[[Any], Any]]=None, reverse: bool=False) -> int:
     ''' 
     return kth largest
+
+    With key, returns the item with the kth smallest key (kth largest if
+    reverse), calling key once per element and leaving A unchanged.
+
+    If numpy is installed, numpy arrays and long numeric lists are handled by
+    numpy's introselect instead, leaving A unchanged.
     '''
+    if key is not None or reverse:
+        # pair keys with indices like _sort_by_key so values are never compared
+        if key is None:
+            decorated = [(x, i) for i, x in enumerate(A)]
+        else:
+            decorated = [(key(x), i) for i, x in enumerate(A)]
+        if reverse:
+            k = len(A) - k + 1
+        _, i = quick_select(decorated, k)
+        return A[i]
+
+    arr = _numpy_array(A)
+    if arr is not None:
+        return np.partition(arr, k-1)[k-1].item()
+
     random.shuffle(A)
-    lo, hi = 0, len(A) - 1
     # 1st smallest is 0 index, 2nd smallest is 1 index, ...
-    k -= 1   
+    _select(A, k - 1)
+    return A[k - 1]
+
 
+def _select(A: List, k: int) -> None:
+    '''
+    repartition A until A[k] holds the item that belongs there in sorted
+    order, with nothing larger before it and nothing smaller after it
+    '''
+    lo, hi = 0, len(A) - 1
     while lo < hi:
         i = partition(A, lo, hi)
         if i > k:
@@ -220,16 +459,219 @@ def quick_select(A: List[int], k: int) -> int:
         elif i < k:
             lo = i + 1
         else:
-            return A[i]
+            return
+
 
-    return A[lo]
+def _median_of_medians(A: List, lo: int, hi: int) -> int:
+    '''
+    return the index of a pivot in A[lo..hi] with at least about 3/10 of the
+    range on either side: sort groups of 5, gather their medians at the
+    front of the range and select the median of those
+    '''
+    if hi - lo < 5:
+        _insertion_sort_range(A, lo, hi)
+        return lo + (hi - lo) // 2
+
+    n_medians = 0
+    for group_lo in range(lo, hi + 1, 5):
+        group_hi = min(group_lo + 4, hi)
+        _insertion_sort_range(A, group_lo, group_hi)
+        median = group_lo + (group_hi - group_lo) // 2
+        A[lo + n_medians], A[median] = A[median], A[lo + n_medians]
+        n_medians += 1
 
+    mid = lo + (n_medians - 1) // 2
+    _linear_select(A, lo, lo + n_medians - 1, mid)
+    return mid
 
-def quick_sort_3way(A: List[int]) -> None: 
 
-    def partition3way(lo: int, hi: int) -> None:
-        if lo >= hi:
+def _linear_select(A: List, lo: int, hi: int, k: int) -> None:
+    '''
+    _select() restricted to A[lo..hi] with median of medians pivots,
+    O(n) worst case time
+    '''
+    while lo < hi:
+        p = _median_of_medians(A, lo, hi)
+        A[lo], A[p] = A[p], A[lo]
+        i = partition(A, lo, hi)
+        if i > k:
+            hi = i - 1
+        elif i < k:
+            lo = i + 1
+        else:
             return
+
+
+def multi_select(A: List, ks: List[int], linear: bool=False) -> List:
+    '''
+    return the k-th smallest item for every k in ks (1st smallest is k=1),
+    in the order of ks.
+
+    All ranks are found in one pass of partitioning: A is shuffled once,
+    then each partition sends the ranks below the pivot left and the ranks
+    above it right, and ranges holding no rank are dropped. With linear,
+    median of medians pivots are used instead of shuffling for O(n) worst
+    case time per rank level. A is rearranged in place like quick_select.
+
+    If numpy is installed, numpy arrays and long numeric lists are handled by
+    a single np.partition over all ranks, leaving A unchanged.
+
+    O(nlog(m)) expected time for m distinct ranks
+    '''
+    N = len(A)
+    for k in ks:
+        if not 1 <= k <= N:
+            raise IndexError('k out of range')
+
+    arr = _numpy_array(A)
+    if arr is not None:
+        if not ks:
+            return []
+        part = np.partition(arr, [k-1 for k in ks])
+        return [part[k-1].item() for k in ks]
+
+    targets = sorted(set(k - 1 for k in ks))
+    if not linear:
+        random.shuffle(A)
+
+    # (lo, hi, t_lo, t_hi): targets[t_lo:t_hi] are the ranks inside A[lo..hi]
+    stack = [(0, N - 1, 0, len(targets))]
+    while stack:
+        lo, hi, t_lo, t_hi = stack.pop()
+        if t_lo >= t_hi or lo >= hi:
+            continue
+
+        if linear:
+            p = _median_of_medians(A, lo, hi)
+            A[lo], A[p] = A[p], A[lo]
+        i = partition(A, lo, hi)
+
+        split = bisect.bisect_left(targets, i, t_lo, t_hi)
+        stack.append((lo, i - 1, t_lo, split))
+        if split < t_hi and targets[split] == i:   # rank i is done
+            split += 1
+        stack.append((i + 1, hi, split, t_hi))
+
+    return [A[k-1] for k in ks]
+
+
+def quantiles(A: List, qs: List[float], linear: bool=False) -> List:
+    '''
+    return the q-quantile of A for every q in qs, e.g. qs=[0.5, 0.9, 0.99]
+    for p50, p90 and p99, all found in one multi_select.
+
+    Uses the nearest-rank definition: the q-quantile is the ceil(q*n)-th
+    smallest item (the smallest for q=0), so results are always items of A.
+    '''
+    N = len(A)
+    if N == 0:
+        raise ValueError('quantiles of an empty list')
+
+    ranks = []
+    for q in qs:
+        if not 0 <= q <= 1:
+            raise ValueError('quantile must be between 0 and 1')
+        # round away float noise such as 0.99 * 100 = 99.00000000000001
+        ranks.append(max(math.ceil(round(q * N, 9)), 1))
+    return multi_select(A, ranks, linear)
+
+
+def partial_sort(A: List, k: int, key: Optional[Callable[[Any], Any]]=None, reverse: bool=False) -> None:
+    '''
+    Rearrange A in place so that A[:k] holds its k smallest items (largest
+    if reverse) in sorted order; the rest of A is left in no particular
+    order. quick select puts the kth item in place in O(n), then only the
+    first k are sorted. Ties keep their original order when key or reverse
+    is given, as in _sort_by_key.
+
+    O(n + klog(k)) expected time
+    '''
+    N = len(A)
+    k = max(0, min(k, N))
+    if k == 0:
+        return
+
+    if key is None and not reverse:
+        random.shuffle(A)
+        _select(A, k - 1)
+        head = A[:k]
+        sort(head)
+        A[:k] = head
+        return
+
+    sign = -1 if reverse else 1
+    if key is None:
+        decorated = [(x, sign*i) for i, x in enumerate(A)]
+    else:
+        decorated = [(key(x), sign*i) for i, x in enumerate(A)]
+    random.shuffle(decorated)
+
+    if reverse:
+        # the k largest end up at the back, then get flipped to the front
+        _select(decorated, N - k)
+        head, rest = decorated[N-k:], decorated[:N-k]
+        sort(head)
+        head.reverse()
+    else:
+        _select(decorated, k - 1)
+        head, rest = decorated[:k], decorated[k:]
+        sort(head)
+
+    A[:] = [A[sign*i] for _, i in head + rest]
+
+
+def nsmallest(iterable: Iterable, k: int, key: Optional[Callable[[Any], Any]]=None) -> List:
+    '''
+    return the k smallest items, same as sorted(iterable, key=key)[:k].
+    Lists are copied and partial sorted; any other iterable is streamed
+    through a TopK so only k items are held at a time.
+    '''
+    if k <= 0:
+        return []
+
+    if isinstance(iterable, list):
+        A = iterable.copy()
+        partial_sort(A, k, key)
+        return A[:k]
+
+    top = TopK(k, key, largest=False)
+    top.extend(iterable)
+    return top.result()
+
+
+def nlargest(iterable: Iterable, k: int, key: Optional[Callable[[Any], Any]]=None) -> List:
+    '''
+    return the k largest items, same as sorted(iterable, key=key, reverse=True)[:k].
+    Lists are copied and partial sorted; any other iterable is streamed
+    through a TopK so only k items are held at a time.
+    '''
+    if k <= 0:
+        return []
+
+    if isinstance(iterable, list):
+        A = iterable.copy()
+        partial_sort(A, k, key, reverse=True)
+        return A[:k]
+
+    top = TopK(k, key)
+    top.extend(iterable)
+    return top.result()
+
+
+def quick_sort_3way(A: List[int], key: Optional[Callable[[Any], Any]]=None, reverse: bool=False) -> None:
+    ''' 
+    iterative like quick_sort: the larger of the < and > ranges is pushed
+    on an explicit stack and the smaller is partitioned next
+    '''
+    if key is not None or reverse:
+        _sort_by_key(quick_sort_3way, A, key, reverse)
+        return
+
+    def partition3way(lo: int, hi: int) -> Tuple[int, int]:
+        '''
+        partition A[lo..hi] around A[lo] into < pivot, == pivot, > pivot
+        and return the bounds lt, gt of the == range
+        '''
         lt, gt = lo, hi 
         pivot_value = A[lo]
         i = lo + 1
@@ -245,36 +687,53 @@ def quick_sort_3way(A: List[int]) -> None:
             # i equal to pivot
             else:
                 i += 1
-        
-        partition3way(lo, lt-1)
-        partition3way(gt+1, hi)
+
+        return lt, gt
 
     random.shuffle(A)
-    partition3way(0, len(A) - 1)
 
+    stack = [(0, len(A) - 1)]
+    while stack:
+        lo, hi = stack.pop()
+        while lo < hi:
+            lt, gt = partition3way(lo, hi)
+            if lt - lo < hi - gt:
+                stack.append((gt+1, hi))
+                hi = lt - 1
+            else:
+                stack.append((lo, lt-1))
+                lo = gt + 1
+
+
+def heap_sort(A: List[int], key: Optional[Callable[[Any], Any]]=None, reverse: bool=False) -> None:
+    if key is not None or reverse:
+        _sort_by_key(heap_sort, A, key, reverse)
+        return
 
-def heap_sort(A: List[int]) -> None:
     def heapify(A: List[int], N: int, i: int) -> None:
-        largest = A[i]
-        left = 2*i + 1
-        right = 2*i + 2
-
-        # See if left child of root exists and is
-        # greater than root
-        if left < N and A[largest] < A[left]:
-            largest = left
+        while True:
+            largest = i
+            left = 2*i + 1
+            right = 2*i + 2
+
+            # See if left child of root exists and is
+            # greater than root
+            if left < N and A[largest] < A[left]:
+                largest = left
  
-        # See if right child of root exists and is
-        # greater than root
-        if right < N and A[largest] < A[right]:
-            largest = right
+            # See if right child of root exists and is
+            # greater than root
+            if right < N and A[largest] < A[right]:
+                largest = right
  
-        # Change root, if needed
-        if largest != i:
+            # Stop once the root is larger than both children
+            if largest == i:
+                return
+
             A[i], A[largest] = A[largest], A[i]  # swap
     
-            # Heapify the root.
-            heapify(A, N, largest)
+            # Continue down from the swapped child
+            i = largest
 
     N = len(A)
  
@@ -287,6 +746,707 @@ def heap_sort(A: List[int]) -> None:
         A[i], A[0] = A[0], A[i]  # swap
         heapify(A, i, 0)
 
+
+def _radix_sort_numpy(arr):
+    '''
+    LSD radix sort of an integer numpy array, one stable counting pass per digit
+    '''
+
+    if arr.dtype.kind == 'i':
+        # flipping the sign bit maps signed order onto unsigned order
+        keys = arr.astype(np.int64).view(np.uint64) ^ np.uint64(1 << 63)
+    else:
+        keys = arr.astype(np.uint64)
+    keys = keys - keys.min()
+
+    span = int(keys.max())
+    mask = np.uint64((1 << RADIX_BITS) - 1)
+    shift = 0
+    while span >> shift:
+        digits = ((keys >> np.uint64(shift)) & mask).astype(np.uint8)
+        order = np.argsort(digits, kind='stable')   # counting sort for uint8
+        keys, arr = keys[order], arr[order]
+        shift += RADIX_BITS
+    return arr
+
+
+def _msd_radix_sort(keys: List[bytes], values: Optional[List]=None) -> None:
+    '''
+    MSD radix sort of a list of byte strings, permuting values alongside
+    keys when given. Ranges are split on the byte at position d into 256
+    buckets plus one in front for keys that end before d, using an explicit
+    stack of (lo, hi, d) instead of recursion.
+    '''
+    stack = [(0, len(keys), 0)]
+    while stack:
+        lo, hi, d = stack.pop()
+
+        if hi - lo <= INSERTION_SORT_CUTOFF:
+            # keys in this range share their first d bytes
+            for i in range(lo + 1, hi):
+                key = keys[i]
+                value = values[i] if values is not None else None
+                j = i - 1
+                while j >= lo and keys[j] > key:
+                    keys[j+1] = keys[j]
+                    if values is not None:
+                        values[j+1] = values[j]
+                    j -= 1
+                keys[j+1] = key
+                if values is not None:
+                    values[j+1] = value
+            continue
+
+        buckets = [[] for _ in range(257)]
+        for i in range(lo, hi):
+            key = keys[i]
+            buckets[key[d] + 1 if len(key) > d else 0].append(i)
+        order = [i for bucket in buckets for i in bucket]
+
+        keys[lo:hi] = [keys[i] for i in order]
+        if values is not None:
+            values[lo:hi] = [values[i] for i in order]
+
+        # keys that ended at d are all equal, the rest continue at d + 1
+        start = lo + len(buckets[0])
+        for bucket in buckets[1:]:
+            if len(bucket) > 1:
+                stack.append((start, start + len(bucket), d + 1))
+            start += len(bucket)
+
+
+def _radix_sort_by_keys(keys: List, A: List) -> None:
+    '''
+    stable radix sort of A by the parallel list keys of ints, bytes or str
+    '''
+    if isinstance(keys[0], (bytes, bytearray)):
+        _msd_radix_sort(keys, A)
+        return
+    if isinstance(keys[0], str):
+        _msd_radix_sort([k.encode('utf-8', 'surrogatepass') for k in keys], A)
+        return
+
+    # LSD over positions, so each pass moves indices instead of pairs
+    lo = min(keys)
+    span = max(keys) - lo
+    mask = (1 << RADIX_BITS) - 1
+    order = range(len(A))
+    shift = 0
+    while span >> shift:
+        buckets = [[] for _ in range(1 << RADIX_BITS)]
+        for i in order:
+            buckets[((keys[i] - lo) >> shift) & mask].append(i)
+        order = [i for bucket in buckets for i in bucket]
+        shift += RADIX_BITS
+    A[:] = [A[i] for i in order]
+
+
+def radix_sort(A: List, key: Optional[Callable[[Any], Any]]=None, reverse: bool=False) -> None:
+    '''
+    Radix sort for integers, byte strings and strings.
+
+    Integers use LSD radix sort. Keys are offset by min(A) so negative values
+    work, then distributed into 2^RADIX_BITS buckets one digit at a time
+    starting from the least significant; each pass is stable so the order
+    from earlier digits is kept.
+
+    bytes and str use MSD radix sort, splitting on the first byte, then the
+    second, and so on. str is compared through its UTF-8 encoding, which
+    orders the same way as the code points.
+
+    If numpy is installed, integer numpy arrays and long integer lists run
+    each pass vectorized.
+
+    With key, the keys (ints, bytes or str) are computed once into a list
+    that is sorted alongside A. reverse sorts descending and stays stable.
+
+    O(w*n) time where w is the number of digits in max(A) - min(A), or the
+    length of the longest common prefix for strings,
+    and O(n) space complexity and a stable sort
+    '''
+    if len(A) < 2:
+        return
+
+    if key is not None or reverse:
+        _stable_reversible(_radix_sort_by_keys, A, key, reverse)
+        return
+
+    arr = _numpy_array(A)
+    if arr is not None:
+        if arr.dtype.kind not in 'iu':
+            raise TypeError('radix_sort requires integer keys')
+        _write_back(A, _radix_sort_numpy(arr))
+        return
+
+    if isinstance(A[0], (bytes, bytearray)):
+        _msd_radix_sort(A)
+        return
+    if isinstance(A[0], str):
+        keys = [x.encode('utf-8', 'surrogatepass') for x in A]
+        _msd_radix_sort(keys, A)
+        return
+
+    lo = min(A)
+    span = max(A) - lo
+    mask = (1 << RADIX_BITS) - 1
+    shift = 0
+    while span >> shift:
+        buckets = [[] for _ in range(1 << RADIX_BITS)]
+        for x in A:
+            buckets[((x - lo) >> shift) & mask].append(x)
+        A[:] = [x for bucket in buckets for x in bucket]
+        shift += RADIX_BITS
+
+
+def _counting_sort_by_keys(keys: List[int], A: List) -> None:
+    '''
+    stable counting sort of A by the parallel list of int keys
+    '''
+    lo = min(keys)
+    counts = [0] * (max(keys) - lo + 1)
+    for k in keys:
+        counts[k - lo] += 1
+
+    # starting position of each key in the output
+    total = 0
+    for offset, count in enumerate(counts):
+        counts[offset] = total
+        total += count
+
+    result = [None] * len(A)
+    for k, x in zip(keys, A):
+        result[counts[k - lo]] = x
+        counts[k - lo] += 1
+    A[:] = result
+
+
+def counting_sort(A: List[int], key: Optional[Callable[[Any], int]]=None, reverse: bool=False) -> None:
+    '''
+    Counting sort for integers from a small range: count how many times each
+    value in min(A)..max(A) occurs, then write the values back in order.
+    Only worth it when the range k is not much larger than n.
+
+    If numpy is installed, integer numpy arrays and long integer lists are
+    counted with np.bincount.
+
+    With key, items are placed by their int key(x), computed once each;
+    this is a stable sort then, also with reverse, and takes O(n + k) space.
+
+    O(n + k) time and O(k) space complexity
+    '''
+    if len(A) < 2:
+        return
+
+    if key is not None or reverse:
+        _stable_reversible(_counting_sort_by_keys, A, key, reverse)
+        return
+
+    arr = _numpy_array(A)
+    if arr is not None:
+        if arr.dtype.kind not in 'iu':
+            raise TypeError('counting_sort requires integer keys')
+        lo = arr.min()
+        # widen signed ints first, arr - lo can overflow a small dtype
+        offsets = arr - lo if arr.dtype.kind == 'u' else arr.astype(np.int64) - lo
+        counts = np.bincount(offsets)
+        # lo + offset always fits arr's dtype, even where the addition wraps
+        values = np.arange(len(counts)).astype(arr.dtype) + lo
+        _write_back(A, np.repeat(values, counts))
+        return
+
+    lo = min(A)
+    counts = [0] * (max(A) - lo + 1)
+    for x in A:
+        counts[x - lo] += 1
+
+    k = 0
+    for offset, count in enumerate(counts):
+        A[k:k+count] = [lo + offset] * count
+        k += count
+
+def _heap_sort_range(A: List, lo: int, hi: int) -> None:
+    '''
+    heap sort of A[lo..hi] inclusive, using a max heap rooted at lo
+    '''
+    def sift_down(i: int, N: int) -> None:
+        while True:
+            largest = i
+            left = 2*i + 1
+            right = left + 1
+            if left < N and A[lo + largest] < A[lo + left]:
+                largest = left
+            if right < N and A[lo + largest] < A[lo + right]:
+                largest = right
+            if largest == i:
+                return
+            A[lo + i], A[lo + largest] = A[lo + largest], A[lo + i]
+            i = largest
+
+    N = hi - lo + 1
+    for i in range(N//2 - 1, -1, -1):
+        sift_down(i, N)
+
+    for i in range(N-1, 0, -1):
+        A[lo], A[lo + i] = A[lo + i], A[lo]
+        sift_down(0, i)
+
+
+def _median_of_three(A: List, lo: int, hi: int) -> None:
+    '''
+    move the median of A[lo], A[mid], A[hi] into A[lo] for partition()
+    '''
+    mid = lo + (hi - lo) // 2
+    if A[mid] < A[lo]:
+        A[mid], A[lo] = A[lo], A[mid]
+    if A[hi] < A[lo]:
+        A[hi], A[lo] = A[lo], A[hi]
+    if A[hi] < A[mid]:
+        A[hi], A[mid] = A[mid], A[hi]
+    # A[lo] <= A[mid] <= A[hi]
+    A[lo], A[mid] = A[mid], A[lo]
+
+
+def _introsort(A: List, lo: int, hi: int, depth_limit: int) -> None:
+    '''
+    quick sort A[lo..hi] with partition(), switching to heap sort once
+    depth_limit levels of partitioning have been used and to insertion sort
+    on small subarrays. Recurses on the smaller side and loops on the larger
+    so the call stack stays O(log(n)).
+    '''
+    while hi - lo + 1 > INSERTION_SORT_CUTOFF:
+        if depth_limit == 0:
+            _heap_sort_range(A, lo, hi)
+            return
+        depth_limit -= 1
+
+        _median_of_three(A, lo, hi)
+        k = partition(A, lo, hi)
+
+        if k - lo < hi - k:
+            _introsort(A, lo, k-1, depth_limit)
+            lo = k + 1
+        else:
+            _introsort(A, k+1, hi, depth_limit)
+            hi = k - 1
+
+    _insertion_sort_range(A, lo, hi)
+
+
+# sort() merges natural runs when they average at least this many elements
+MIN_RUN = 32
+
+
+def _natural_runs(A: List) -> Optional[List[int]]:
+    '''
+    run detection: split A into ascending runs, reversing strictly
+    descending ones in place (which keeps them stable), and return the
+    start of each run followed by len(A). Returns None as soon as there
+    are more than a few runs per MIN_RUN elements scanned, so unsorted
+    input costs only a few comparisons.
+    '''
+    N = len(A)
+    starts = []
+    lo = 0
+    while lo < N:
+        starts.append(lo)
+        i = lo + 1
+        if i < N and A[i] < A[lo]:
+            while i < N and A[i] < A[i-1]:
+                i += 1
+            A[lo:i] = A[lo:i][::-1]
+        else:
+            while i < N and not A[i] < A[i-1]:
+                i += 1
+        if len(starts) > 8 + i // MIN_RUN:
+            return None
+        lo = i
+    starts.append(N)
+    return starts
+
+
+def _merge_short(src: List, dst: List, lo: int, mid: int, hi: int) -> None:
+    '''
+    _merge() for when one of src[lo..mid] and src[mid+1..hi] is much
+    shorter than the other: each element of the short side is placed by
+    binary search in the long side, which is copied across in slices
+    '''
+    if mid - lo <= hi - mid - 1:
+        k, j = lo, mid + 1
+        for i in range(lo, mid + 1):
+            x = src[i]
+            p = bisect.bisect_left(src, x, j, hi + 1)   # ties stay after x
+            dst[k:k+p-j] = src[j:p]
+            k += p - j
+            dst[k] = x
+            k += 1
+            j = p
+        dst[k:hi+1] = src[j:hi+1]
+    else:
+        k, i = hi, mid
+        for j in range(hi, mid, -1):
+            x = src[j]
+            p = bisect.bisect_right(src, x, lo, i + 1)   # ties stay before x
+            dst[k-i+p:k+1] = src[p:i+1]
+            k -= i + 1 - p
+            dst[k] = x
+            k -= 1
+            i = p - 1
+        dst[lo:k+1] = src[lo:i+1]
+
+
+def _merge_runs(A: List, starts: List[int]) -> None:
+    '''
+    merge neighbouring runs of A pairwise until one is left, each pass
+    merging from one of A and aux into the other as merge_sort2 does.
+    Elements already in place at either end of a pair are found by binary
+    search and copied as slices, and a run much shorter than the one it is
+    merged with goes through _merge_short, so either costs little more than
+    the copy.
+    '''
+    N = len(A)
+    src, dst = A, A.copy()
+    while len(starts) > 2:
+        for r in range(0, len(starts) - 2, 2):
+            lo, mid, hi = starts[r], starts[r+1] - 1, starts[r+2] - 1
+            first = bisect.bisect_right(src, src[mid+1], lo, mid + 1)
+            last = bisect.bisect_left(src, src[mid], mid + 1, hi + 1)
+            dst[lo:first] = src[lo:first]
+            dst[last:hi+1] = src[last:hi+1]
+            if first > mid:
+                continue
+            left, right = mid + 1 - first, last - 1 - mid
+            if 4 * min(left, right) < max(left, right):
+                _merge_short(src, dst, first, mid, last - 1)
+            else:
+                _merge(src, dst, first, mid, last - 1)
+
+        # carry an unpaired last run over to dst
+        starts = starts[::2]
+        if starts[-1] != N:
+            dst[starts[-1]:N] = src[starts[-1]:N]
+            starts.append(N)
+        src, dst = dst, src
+
+    if src is not A:
+        A[:] = src
+
+
+def sort(A: List, key: Optional[Callable[[Any], Any]]=None, reverse: bool=False) -> None:
+    '''
+    Hybrid sort combining the sorts above (introsort):
+        - input made of a few long ascending or descending runs (sorted,
+          reversed, sorted with items appended, interleaved sorted lists)
+          has its runs merged, O(n) for a single run
+        - otherwise quick sort with median-of-three pivots and partition()
+        - once the recursion gets deeper than 2*log2(n), that subarray falls back to heap sort
+        - subarrays of INSERTION_SORT_CUTOFF or fewer elements are finished with insertion sort
+
+    If key or reverse is given, key is called exactly once per element and
+    ties keep their original order (see _sort_by_key).
+
+    If numpy is installed, numpy arrays and long numeric lists are sorted with
+    numpy's stable sort instead.
+
+    O(nlog(n)) worst case time and O(log(n)) space complexity, O(n) space
+    when runs are merged
+    '''
+    if key is not None or reverse:
+        _sort_by_key(sort, A, key, reverse)
+        return
+
+    arr = _numpy_array(A)
+    if arr is not None:
+        _write_back(A, np.sort(arr, kind='stable'))
+        return
+
+    starts = _natural_runs(A)
+    if starts is None:
+        N = len(A)
+        _introsort(A, 0, N - 1, 2 * int(math.log2(N)))
+    elif len(starts) > 2:
+        _merge_runs(A, starts)
+
+
+def _kway_merge(runs: List[Iterator]) -> Iterator:
+    '''
+    merge sorted iterators with a MinHeap holding the head of each one.
+    The heap holds (item, run index); the index breaks ties between runs
+    in run order and says which run to refill from.
+    '''
+    heap = MinHeap()
+    for i, run in enumerate(runs):
+        for x in run:
+            heap.insert((x, i))
+            break
+
+    while not heap.is_empty():
+        x, i = heap.pop()
+        yield x
+        for x in runs[i]:
+            heap.insert((x, i))
+            break
+
+
+def _spill_run(run: List, tmpdir: Optional[str]) -> IO[bytes]:
+    '''
+    write a sorted run to an anonymous temp file as a sequence of pickled
+    blocks and return the file rewound to the start
+    '''
+    f = tempfile.TemporaryFile(dir=tmpdir)
+    for i in range(0, len(run), EXTERNAL_BLOCK_SIZE):
+        pickle.dump(run[i:i+EXTERNAL_BLOCK_SIZE], f, pickle.HIGHEST_PROTOCOL)
+    f.seek(0)
+    return f
+
+
+def _read_run(f: IO[bytes]) -> Iterator:
+    '''
+    stream a run back one block at a time
+    '''
+    while True:
+        try:
+            block = pickle.load(f)
+        except EOFError:
+            return
+        yield from block
+
+
+def external_sort(iterable: Iterable, chunk_size: int=1_000_000, tmpdir: Optional[str]=None) -> Iterator:
+    '''
+    External merge sort for inputs that do not fit in memory. Reads
+    chunk_size items at a time, sorts each chunk with sort() and spills it
+    to a temp file in tmpdir (the system default if None), then k-way merges
+    the runs with a MinHeap holding the head of each run. Items come back
+    lazily from the returned generator; the temp files are removed once it is
+    exhausted or closed.
+
+    Input that fits in a single chunk is never written to disk.
+
+    Raises ValueError right away if chunk_size is not positive.
+
+    O(nlog(n)) time, O(chunk_size + k) memory for k runs and O(n) disk space
+    '''
+    if chunk_size <= 0:
+        raise ValueError('chunk_size must be positive')
+    return _external_sort(iterable, chunk_size, tmpdir)
+
+
+def _external_sort(iterable: Iterable, chunk_size: int, tmpdir: Optional[str]) -> Iterator:
+    '''
+    generator behind external_sort, so arguments are checked on the call
+    rather than on the first next()
+    '''
+    runs: List[IO[bytes]] = []
+    try:
+        chunk = []
+        for x in iterable:
+            chunk.append(x)
+            if len(chunk) == chunk_size:
+                sort(chunk)
+                runs.append(_spill_run(chunk, tmpdir))
+                chunk = []
+
+        sort(chunk)
+        if not runs:
+            yield from chunk
+            return
+        if chunk:
+            runs.append(_spill_run(chunk, tmpdir))
+        chunk = []
+
+        yield from _kway_merge([_read_run(f) for f in runs])
+    finally:
+        for f in runs:
+            f.close()
+
+
+def _shared_typecode(A: List) -> Optional[str]:
+    '''
+    array typecode to pass A through shared memory with, or None if A
+    holds anything other than int64-sized ints or floats
+    '''
+    t = type(A[0])
+    if t not in (int, float) or not all(type(x) is t for x in A):
+        return None
+    if t is float:
+        return 'd'
+    if -2**63 <= min(A) and max(A) < 2**63:
+        return 'q'
+    return None
+
+
+def _shards(N: int, workers: int) -> List[Tuple[int, int]]:
+    '''
+    split range(N) into workers contiguous [lo, hi) pieces
+    '''
+    step = -(-N // workers)
+    return [(lo, min(lo + step, N)) for lo in range(0, N, step)]
+
+
+def _sort_shared_shard(name: str, typecode: str, lo: int, hi: int) -> None:
+    '''
+    worker: sort A[lo:hi] of the array in shared memory block name in place
+    '''
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        view = shm.buf.cast(typecode)
+        shard = view[lo:hi].tolist()
+        sort(shard)
+        view[lo:hi] = array(typecode, shard)
+        view.release()
+    finally:
+        shm.close()
+
+
+def _sorted_shard(shard: List) -> List:
+    '''
+    worker: sort a pickled shard and send it back
+    '''
+    sort(shard)
+    return shard
+
+
+def _count_shared_shard(name: str, typecode: str, lo: int, hi: int, low, high) -> Tuple[int, List]:
+    '''
+    worker: for A[lo:hi] in shared memory, count the items below low and
+    return those between low and high inclusive
+    '''
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        view = shm.buf.cast(typecode)
+        shard = view[lo:hi].tolist()
+        view.release()
+    finally:
+        shm.close()
+    return _count_shard(shard, low, high)
+
+
+def _count_shard(shard: List, low, high) -> Tuple[int, List]:
+    '''
+    worker: count the items below low and return those between low and high inclusive
+    '''
+    below = 0
+    between = []
+    for x in shard:
+        if x < low:
+            below += 1
+        elif not high < x:
+            between.append(x)
+    return below, between
+
+
+def _to_shared_memory(A: List, typecode: str) -> shared_memory.SharedMemory:
+    shm = shared_memory.SharedMemory(create=True, size=max(len(A), 1) * array(typecode).itemsize)
+    view = shm.buf.cast(typecode)
+    view[:len(A)] = array(typecode, A)
+    view.release()
+    return shm
+
+
+def parallel_sort(A: List, workers: Optional[int]=None) -> None:
+    '''
+    Sort A across worker processes: split it into one contiguous shard per
+    worker, sort the shards with sort() in a ProcessPoolExecutor, then k-way
+    merge them back into A with heapq.merge, whose C merge keeps the serial
+    part of the work small.
+
+    Lists of ints (fitting int64) or floats are shared with the workers
+    through a multiprocessing.shared_memory block, so the data is never
+    pickled; workers sort their slice of the block in place. Any other
+    items are pickled to and from the workers shard by shard.
+    Lists shorter than PARALLEL_THRESHOLD are sorted in this process.
+
+    O(nlog(n)/workers + nlog(workers)) time and O(n) space complexity
+    '''
+    N = len(A)
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or N < max(PARALLEL_THRESHOLD, 2):
+        sort(A)
+        return
+
+    shards = _shards(N, workers)
+    typecode = _shared_typecode(A)
+
+    if typecode is None:
+        with ProcessPoolExecutor(len(shards)) as executor:
+            runs = list(executor.map(_sorted_shard, (A[lo:hi] for lo, hi in shards)))
+        A[:] = list(heapq.merge(*runs))
+        return
+
+    shm = _to_shared_memory(A, typecode)
+    try:
+        with ProcessPoolExecutor(len(shards)) as executor:
+            futures = [executor.submit(_sort_shared_shard, shm.name, typecode, lo, hi)
+                       for lo, hi in shards]
+            for future in futures:
+                future.result()
+
+        view = shm.buf.cast(typecode)
+        runs = [view[lo:hi].tolist() for lo, hi in shards]
+        view.release()
+        A[:] = list(heapq.merge(*runs))
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+def parallel_select(A: List, k: int, workers: Optional[int]=None) -> Any:
+    '''
+    Return the kth smallest item of A (1st smallest is k=1) using worker
+    processes, leaving A unchanged.
+
+    A random sample of A is sorted to pick two pivots that bracket rank k
+    with high probability. Each worker counts the items of its shard below
+    the lower pivot and returns the items between the pivots, so only that
+    small middle band comes back to this process, where quick_select finds
+    the answer in it. If the sample was unlucky and rank k falls outside
+    the band, falls back to quick_select over all of A.
+    Data is shared with the workers the same way as in parallel_sort.
+
+    O(n/workers) expected time per worker
+    '''
+    N = len(A)
+    if not 1 <= k <= N:
+        raise IndexError('k out of range')
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or N < max(PARALLEL_THRESHOLD, 2):
+        return quick_select(list(A), k)
+
+    # sample of size ~n^(2/3) with a band of ~sqrt(s*log(n)) either side of k
+    s = min(N, max(1000, int(N ** (2/3))))
+    sample = random.sample(A, s)
+    sort(sample)
+    gap = int(math.sqrt(s * math.log(N))) + 1
+    target = (k - 1) * s // N
+    low = sample[max(target - gap, 0)]
+    high = sample[min(target + gap, s - 1)]
+
+    shards = _shards(N, workers)
+    typecode = _shared_typecode(A)
+
+    if typecode is None:
+        with ProcessPoolExecutor(len(shards)) as executor:
+            results = list(executor.map(_count_shard, (A[lo:hi] for lo, hi in shards),
+                                        [low] * len(shards), [high] * len(shards)))
+    else:
+        shm = _to_shared_memory(A, typecode)
+        try:
+            with ProcessPoolExecutor(len(shards)) as executor:
+                futures = [executor.submit(_count_shared_shard, shm.name, typecode, lo, hi, low, high)
+                           for lo, hi in shards]
+                results = [future.result() for future in futures]
+        finally:
+            shm.close()
+            shm.unlink()
+
+    below = sum(b for b, _ in results)
+    between = [x for _, band in results for x in band]
+    if below < k <= below + len(between):
+        return quick_select(between, k - below)
+
+    return quick_select(list(A), k)
+
+
 def make_example() -> List[int]:
     return [4, 1, 10, 3, 2, 4, 1, 5, 9, 8, 4, 15]
 
@@ -325,6 +1485,13 @@ if __name__ == '__main__':
     print(A)
 
 
+    print('\nMerge Sort V2, reusing a scratch buffer:')
+    buffer = []
+    for A in (make_example(), [3, 2, 1] * 10):
+        merge_sort2(A, buffer=buffer)
+        print(A)
+
+
     print('\nQuick Sort:')
     A = [4, 1, 10, 3, 2, 11, 0, 5, 9, 8, 6, 15]
     quick_sort(A)
@@ -338,6 +1505,19 @@ if __name__ == '__main__':
     print('12th Smallest: ', quick_select(A, 12))
 
 
+    print('\nMulti Select, 1st, 6th and 12th smallest:')
+    A = make_example() 
+    print(multi_select(A, [1, 6, 12]))
+    print('p50, p90:', quantiles(A, [0.5, 0.9]))
+
+
+    print('\nPartial Sort, 4 smallest first:')
+    A = make_example() 
+    partial_sort(A, 4)
+    print(A[:4])
+    print('3 largest: ', nlargest(iter(make_example()), 3))
+
+
     print('\n3-Way Quick Sort :')
     A = make_example() 
     quick_sort_3way(A)
@@ -347,4 +1527,34 @@ if __name__ == '__main__':
     print('\nHeap Sort:')
     A = make_example() 
     heap_sort(A)
-    print(A)
\ No newline at end of file
+    print(A)
+
+
+    print('\nRadix Sort:')
+    A = [170, -45, 75, -90, 802, 24, 2, 66]
+    radix_sort(A)
+    print(A)
+    A = ['she', 'sells', 'seashells', 'by', 'the', 'sea', 'shore']
+    radix_sort(A)
+    print(A)
+
+
+    print('\nCounting Sort:')
+    A = make_example() 
+    counting_sort(A)
+    print(A)
+
+
+    print('\nHybrid Sort:')
+    A = make_example() 
+    sort(A)
+    print(A)
+
+    print('\nHybrid Sort, reversed by key:')
+    A = ['pear', 'fig', 'banana', 'kiwi', 'apple']
+    sort(A, key=len, reverse=True)
+    print(A)
+
+
+    print('\nExternal Sort, 3 items per run:')
+    print(list(external_sort(make_example(), chunk_size=3)))
\ No newline at end of file
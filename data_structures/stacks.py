@@ -1,9 +1,12 @@
-from data_structures.linked_lists.node import Node
+from typing import Optional
+
+from data_structures.linked_lists.single_node import Node, NodePool
 
 class LinkedListStack:
 
-    def __init__(self):
+    def __init__(self, pool: Optional[NodePool]=None):
         self.top : Node = None
+        self._pool = pool    # reuse popped nodes if given
 
 
     def is_empty(self):
@@ -16,7 +19,9 @@ class LinkedListStack:
             return self.top.data
 
     def push(self, value):
-        if self.is_empty():
+        if self._pool is not None:
+            self.top = self._pool.acquire(value, self.top)
+        elif self.is_empty():
             self.top = Node(value)
         else:
             t = Node(value)    # make new Node for new head
@@ -27,8 +32,11 @@ class LinkedListStack:
         if self.is_empty():
             raise ValueError('Stack is empty')
         else:
-            val = self.top.data       # get data of head
-            self.top = self.top.next  # remove head
+            node = self.top
+            val = node.data           # get data of head
+            self.top = node.next      # remove head
+            if self._pool is not None:
+                self._pool.release(node)
 
             return val
 
@@ -71,4 +79,14 @@ if __name__ == '__main__':
     assert result == ans, f'Error: is_empty() should return {ans} but returned {result}'
 
     # should throw ValueError
-    # s.pop()
\ No newline at end of file
+    # s.pop()
+
+    # same again, recycling nodes through a pool
+    pool = NodePool()
+    s = LinkedListStack(pool)
+    for i in values:
+        s.push(i)
+    result = [s.pop() for _ in values]
+    assert result == ans_stack, f'Error: pop() should return {ans_stack} but returned {result}'
+    s.push(1)
+    assert len(pool) == len(values) - 1 and s.peek() == 1
\ No newline at end of file
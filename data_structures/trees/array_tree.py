@@ -0,0 +1,172 @@
+from array import array
+from collections import deque
+from typing import Iterator, List, Optional, Sequence
+
+from data_structures.trees import binary
+from data_structures.trees.binary import BinaryTreeNode
+
+try:
+    import numpy as np
+except ImportError:   # numpy is optional, height falls back to a loop
+    np = None
+
+# trees with at least this many nodes compute height with numpy when installed
+NUMPY_THRESHOLD = 10_000
+
+# child index meaning no child
+NIL = -1
+
+
+# Binary tree stored as a struct of arrays instead of one object per node:
+# node i has data[i], and left[i]/right[i] are the indices of its children,
+# or NIL. Child links are typed arrays, 4 bytes each while there are fewer
+# than 2**31 nodes; data is a typed array too if a typecode is given, else a
+# list. from_binary_tree numbers nodes in level order, so children always come
+# after their parent and a level-order traversal is a scan of data.
+# All traversals use explicit stacks or queues of indices.
+# Time Complexity:
+    # - height/traversals: O(n)
+    # - size: O(1)
+class ArrayTree:
+
+
+    def __init__(self, data: Sequence, left: Sequence[int], right: Sequence[int], root: int=0) -> None:
+        if not len(data) == len(left) == len(right):
+            raise ValueError('data, left and right must have the same length')
+        typecode = 'i' if len(data) < 2**31 else 'q'
+        self.data = data
+        self.left: array = array(typecode, left)
+        self.right: array = array(typecode, right)
+        self.root: int = root if len(data) else NIL
+
+    @classmethod
+    def from_binary_tree(cls, root: Optional[BinaryTreeNode], typecode: Optional[str]=None) -> 'ArrayTree':
+        '''
+        copy a BinaryTreeNode tree, numbering its nodes in level order.
+        With typecode, data is stored in an array of that type.
+        '''
+        data = array(typecode) if typecode else []
+        left, right = [], []
+        queue = deque([root] if root else [])
+        n = len(queue)
+        while queue:
+            node = queue.popleft()
+            data.append(node.data)
+            for child, links in ((node.left, left), (node.right, right)):
+                if child:
+                    links.append(n)
+                    n += 1
+                    queue.append(child)
+                else:
+                    links.append(NIL)
+        return cls(data, left, right)
+
+    def to_binary_tree(self) -> Optional[BinaryTreeNode]:
+        '''
+        build the equivalent tree of BinaryTreeNodes
+        '''
+        if self.root == NIL:
+            return None
+        nodes = [BinaryTreeNode(x) for x in self.data]
+        for node, l, r in zip(nodes, self.left, self.right):
+            if l != NIL:
+                node.left = nodes[l]
+            if r != NIL:
+                node.right = nodes[r]
+        return nodes[self.root]
+
+    def size(self) -> int:
+        return len(self.data)
+
+    def height(self) -> int:
+        '''
+        number of levels, found by expanding one whole level at a time
+        '''
+        if self.root == NIL:
+            return 0
+
+        if np is not None and len(self.data) >= NUMPY_THRESHOLD:
+            left = np.frombuffer(self.left, dtype=self.left.typecode)
+            right = np.frombuffer(self.right, dtype=self.right.typecode)
+            level = np.array([self.root])
+            h = 0
+            while level.size:
+                h += 1
+                children = np.concatenate((left[level], right[level]))
+                level = children[children != NIL]
+            return h
+
+        left, right = self.left, self.right
+        level: List[int] = [self.root]
+        h = 0
+        while level:
+            h += 1
+            level = [c for i in level for c in (left[i], right[i]) if c != NIL]
+        return h
+
+    def iter_preorder(self) -> Iterator:
+        data, left, right = self.data, self.left, self.right
+        stack = [self.root] if self.root != NIL else []
+        while stack:
+            i = stack.pop()
+            yield data[i]
+            if right[i] != NIL:
+                stack.append(right[i])
+            if left[i] != NIL:
+                stack.append(left[i])
+
+    def iter_inorder(self) -> Iterator:
+        data, left, right = self.data, self.left, self.right
+        stack = []
+        i = self.root
+        while stack or i != NIL:
+            while i != NIL:
+                stack.append(i)
+                i = left[i]
+            i = stack.pop()
+            yield data[i]
+            i = right[i]
+
+    def iter_postorder(self) -> Iterator:
+        data, left, right = self.data, self.left, self.right
+        stack = []
+        i = self.root
+        last = NIL   # last node yielded
+        while stack or i != NIL:
+            while i != NIL:
+                stack.append(i)
+                i = left[i]
+            top = stack[-1]
+            if right[top] != NIL and right[top] != last:
+                i = right[top]
+            else:
+                yield data[top]
+                last = stack.pop()
+
+    def iter_levelorder(self) -> Iterator:
+        data, left, right = self.data, self.left, self.right
+        queue = deque([self.root] if self.root != NIL else [])
+        while queue:
+            i = queue.popleft()
+            yield data[i]
+            if left[i] != NIL:
+                queue.append(left[i])
+            if right[i] != NIL:
+                queue.append(right[i])
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+
+if __name__ == '__main__':
+
+    tree = ArrayTree.from_binary_tree(binary.make_tree_example(), typecode='l')
+    print('data:', list(tree.data))
+    print('left:', list(tree.left))
+    print('right:', list(tree.right))
+    print('height:', tree.height(), 'size:', tree.size())
+    print('pre-order:', list(tree.iter_preorder()))
+    print('in-order:', list(tree.iter_inorder()))
+    print('post-order:', list(tree.iter_postorder()))
+    print('level-order:', list(tree.iter_levelorder()))
+    assert list(binary.iter_inorder(tree.to_binary_tree())) == list(tree.iter_inorder())
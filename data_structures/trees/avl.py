@@ -0,0 +1,288 @@
+from typing import Any, Iterator, List, Optional, Tuple
+
+from data_structures.trees import binary
+from data_structures.trees.binary import BinaryTreeNode
+
+
+class AVLNode(BinaryTreeNode):
+    '''
+    BinaryTreeNode holding a key in data, plus the value stored under it and
+    the height and size of its subtree
+    '''
+    __slots__ = ('value', 'height', 'size')
+
+    def __init__(self, data=None, value=None) -> None:
+        super().__init__(data)
+        self.value = value
+        self.height: int = 1
+        self.size: int = 1
+
+
+def _height(node: Optional[AVLNode]) -> int:
+    return node.height if node else 0
+
+
+def _size(node: Optional[AVLNode]) -> int:
+    return node.size if node else 0
+
+
+def _update(node: AVLNode) -> None:
+    node.height = 1 + max(_height(node.left), _height(node.right))
+    node.size = 1 + _size(node.left) + _size(node.right)
+
+
+def _rotate_right(y: AVLNode) -> AVLNode:
+    x = y.left
+    y.left = x.right
+    x.right = y
+    _update(y)
+    _update(x)
+    return x
+
+
+def _rotate_left(x: AVLNode) -> AVLNode:
+    y = x.right
+    x.right = y.left
+    y.left = x
+    _update(x)
+    _update(y)
+    return y
+
+
+def _rebalance(node: AVLNode) -> AVLNode:
+    '''
+    fix heights and sizes of node and rotate if its subtrees differ in
+    height by 2; return the new root of the subtree
+    '''
+    _update(node)
+    balance = _height(node.left) - _height(node.right)
+    if balance > 1:
+        if _height(node.left.left) < _height(node.left.right):
+            node.left = _rotate_left(node.left)
+        return _rotate_right(node)
+    if balance < -1:
+        if _height(node.right.right) < _height(node.right.left):
+            node.right = _rotate_right(node.right)
+        return _rotate_left(node)
+    return node
+
+
+# Ordered map kept as an AVL tree: the heights of the two subtrees of every
+# node differ by at most one, so the tree is at most ~1.44log(n) deep whatever
+# the insertion order. Nodes also store the size of their subtree for
+# rank/select. All operations walk down from the root with a loop and fix
+# the path back up from an explicit stack, so nothing recurses.
+#
+# root is a plain BinaryTreeNode tree with the keys in data, so the functions
+# in binary.py work on it directly.
+# Time Complexity:
+    # - insert/delete/search/floor/ceiling/rank/select: O(log(n))
+    # - items(lo, hi): O(log(n) + k) for k items in range
+class AVLTree:
+
+
+    def __init__(self) -> None:
+        self.root: Optional[AVLNode] = None
+
+    def _fix_path(self, path: List[AVLNode], delta: int) -> None:
+        '''
+        rebalance every node on path, deepest first, relinking each to its
+        parent. Once a subtree keeps its height the nodes above cannot need
+        rotating, so they only get their size adjusted by delta.
+        '''
+        for i in range(len(path) - 1, -1, -1):
+            node = path[i]
+            old_height = node.height
+            new = _rebalance(node)
+            if new is node:
+                if node.height == old_height:
+                    for ancestor in path[:i]:
+                        ancestor.size += delta
+                    return
+            elif i == 0:
+                self.root = new
+            elif path[i-1].left is node:
+                path[i-1].left = new
+            else:
+                path[i-1].right = new
+
+    def insert(self, key, value=None) -> None:
+        '''
+        map key to value, replacing the value if key is already present
+        '''
+        path = []
+        node = self.root
+        while node:
+            if key == node.data:
+                node.value = value
+                return
+            path.append(node)
+            node = node.left if key < node.data else node.right
+
+        node = AVLNode(key, value)
+        if not path:
+            self.root = node
+            return
+        parent = path[-1]
+        if key < parent.data:
+            parent.left = node
+        else:
+            parent.right = node
+        self._fix_path(path, 1)
+
+    def delete(self, key) -> None:
+        '''
+        remove key, raising KeyError if it is not present
+        '''
+        path = []
+        node = self.root
+        while node and node.data != key:
+            path.append(node)
+            node = node.left if key < node.data else node.right
+        if node is None:
+            raise KeyError(key)
+
+        # with two children, move the inorder successor's entry here and
+        # unlink the successor instead, which has no left child
+        if node.left and node.right:
+            path.append(node)
+            successor = node.right
+            while successor.left:
+                path.append(successor)
+                successor = successor.left
+            node.data, node.value = successor.data, successor.value
+            node = successor
+
+        child = node.left or node.right
+        if not path:
+            self.root = child
+        elif path[-1].left is node:
+            path[-1].left = child
+        else:
+            path[-1].right = child
+        self._fix_path(path, -1)
+
+    def search(self, key) -> Optional[AVLNode]:
+        '''
+        return the node holding key, or None
+        '''
+        node = self.root
+        while node and node.data != key:
+            node = node.left if key < node.data else node.right
+        return node
+
+    def get(self, key, default=None):
+        node = self.search(key)
+        return default if node is None else node.value
+
+    def floor(self, key) -> Any:
+        '''
+        return the largest key <= key, or None if there is none
+        '''
+        result = None
+        node = self.root
+        while node:
+            if node.data == key:
+                return key
+            if node.data < key:
+                result = node.data
+                node = node.right
+            else:
+                node = node.left
+        return result
+
+    def ceiling(self, key) -> Any:
+        '''
+        return the smallest key >= key, or None if there is none
+        '''
+        result = None
+        node = self.root
+        while node:
+            if node.data == key:
+                return key
+            if key < node.data:
+                result = node.data
+                node = node.left
+            else:
+                node = node.right
+        return result
+
+    def rank(self, key) -> int:
+        '''
+        return the number of keys smaller than key
+        '''
+        rank = 0
+        node = self.root
+        while node:
+            if key <= node.data:
+                if key == node.data:
+                    return rank + _size(node.left)
+                node = node.left
+            else:
+                rank += _size(node.left) + 1
+                node = node.right
+        return rank
+
+    def select(self, k: int) -> Any:
+        '''
+        return the key of rank k, i.e. the (k+1)th smallest
+        '''
+        if not 0 <= k < len(self):
+            raise IndexError('k out of range')
+        node = self.root
+        while True:
+            left = _size(node.left)
+            if k < left:
+                node = node.left
+            elif k == left:
+                return node.data
+            else:
+                k -= left + 1
+                node = node.right
+
+    def items(self, lo=None, hi=None) -> Iterator[Tuple[Any, Any]]:
+        '''
+        yield (key, value) in key order for lo <= key <= hi, either bound
+        open if None
+        '''
+        stack = []
+        node = self.root
+        while stack or node:
+            # go left, skipping subtrees that are entirely below lo
+            while node:
+                if lo is not None and node.data < lo:
+                    node = node.right
+                else:
+                    stack.append(node)
+                    node = node.left
+            if not stack:
+                return
+            node = stack.pop()
+            if hi is not None and hi < node.data:
+                return
+            yield node.data, node.value
+            node = node.right
+
+    def __contains__(self, key) -> bool:
+        return self.search(key) is not None
+
+    def __iter__(self) -> Iterator:
+        return (key for key, _ in self.items())
+
+    def __len__(self) -> int:
+        return _size(self.root)
+
+
+if __name__ == '__main__':
+
+    tree = AVLTree()
+    for key in range(1, 16):   # increasing keys would make bst.insert a linked list
+        tree.insert(key, str(key))
+    binary.traversal_levelorder(tree.root)
+    print('\nheight:', binary.height(tree.root), 'size:', len(tree))
+
+    tree.delete(8)
+    tree.delete(1)
+    print('floor(8):', tree.floor(8), 'ceiling(8):', tree.ceiling(8))
+    print('rank(10):', tree.rank(10), 'select(0):', tree.select(0))
+    print('items(5, 11):', list(tree.items(5, 11)))
@@ -1,7 +1,8 @@
 from collections import deque
-from typing import List 
+from typing import Iterator, List 
 
 class BinaryTreeNode:
+    __slots__ = ('data', 'left', 'right')
 
     def __init__(self, data=None, left=None, right=None) -> None:
         self.data = data
@@ -74,21 +75,8 @@ def traversal_postorder(root: BinaryTreeNode) -> None:
 
 
 def traversal_postorder_list(root: BinaryTreeNode) -> List[int]:
-    def postorder_helper(root: BinaryTreeNode) -> None:
-        if root:
-            postorder_helper(root.left)
-            postorder_helper(root.right)
-            result.append(root.data)
+    return list(iter_postorder(root))
 
-    result = []
-
-    if not root:
-        return result
-
-    postorder_helper(root)
-
-    return result
-    
 
 
 def traversal_levelorder(root: BinaryTreeNode) -> None:
@@ -113,6 +101,116 @@ def traversal_levelorder(root: BinaryTreeNode) -> None:
 
 
 
+def iter_preorder(root: BinaryTreeNode) -> Iterator:
+    '''
+    lazily yield data in pre-order, with an explicit stack instead of recursion
+    '''
+    stack = [root] if root else []
+    while stack:
+        node = stack.pop()
+        yield node.data
+
+        # push right first so the left subtree comes out first
+        if node.right:
+            stack.append(node.right)
+        if node.left:
+            stack.append(node.left)
+
+
+def _iter_inorder_morris(root: BinaryTreeNode) -> Iterator:
+    '''
+    Morris traversal: before going into a left subtree, point the right link
+    of its last node back at the current node, follow that thread up
+    afterwards and remove it again. Uses O(1) extra space.
+    '''
+    node = root
+    closed = False
+    while node:
+        if node.left is None:
+            visit = node
+            node = node.right
+        else:
+            pred = node.left
+            while pred.right is not None and pred.right is not node:
+                pred = pred.right
+
+            if pred.right is None:
+                pred.right = node   # thread back to node
+                node = node.left
+                continue
+            pred.right = None       # left subtree done, unthread
+            visit = node
+            node = node.right
+
+        # if the caller stops early, finish the walk silently to remove the threads
+        if not closed:
+            try:
+                yield visit.data
+            except GeneratorExit:
+                closed = True
+
+
+def iter_inorder(root: BinaryTreeNode, morris: bool=False) -> Iterator:
+    '''
+    lazily yield data in in-order, with an explicit stack, or in O(1) extra
+    space with morris=True. Morris traversal temporarily rewires right links,
+    so the tree must not be read or changed by anything else until the
+    iterator is exhausted or closed.
+    '''
+    if morris:
+        yield from _iter_inorder_morris(root)
+        return
+
+    stack = []
+    node = root
+    while stack or node:
+        while node:
+            stack.append(node)
+            node = node.left
+        node = stack.pop()
+        yield node.data
+        node = node.right
+
+
+def iter_postorder(root: BinaryTreeNode) -> Iterator:
+    '''
+    lazily yield data in post-order, with an explicit stack
+    '''
+    stack = []
+    node = root
+    last = None   # last node yielded
+    while stack or node:
+        while node:
+            stack.append(node)
+            node = node.left
+
+        top = stack[-1]
+        # go right unless the right subtree is empty or was just finished
+        if top.right and top.right is not last:
+            node = top.right
+        else:
+            yield top.data
+            last = stack.pop()
+
+
+def iter_levelorder(root: BinaryTreeNode) -> Iterator:
+    '''
+    lazily yield data level by level, left to right
+    '''
+    if root is None:
+        return
+
+    queue = deque([root])
+    while queue:
+        node = queue.popleft()
+        yield node.data
+
+        if node.left:
+            queue.append(node.left)
+        if node.right:
+            queue.append(node.right)
+
+
 def height(root: BinaryTreeNode) -> int:
     if root is None:
         return 0
@@ -175,3 +273,10 @@ if __name__ == '__main__':
     traversal_levelorder(tree)
 
     print('\n', traversal_postorder_list(tree))
+
+    tree = make_tree_example()
+    print('iter_preorder:', list(iter_preorder(tree)))
+    print('iter_inorder:', list(iter_inorder(tree)))
+    print('iter_inorder (Morris):', list(iter_inorder(tree, morris=True)))
+    print('iter_postorder:', list(iter_postorder(tree)))
+    print('iter_levelorder:', list(iter_levelorder(tree)))
@@ -0,0 +1,256 @@
+from bisect import bisect_left, bisect_right
+from typing import Any, Iterable, Iterator, List, Optional, Tuple
+
+
+# Ordered map kept as a list of sorted sublists of keys (with parallel lists
+# of values), a two level B-tree in effect. _maxes holds the last key of each
+# sublist, so a lookup is one bisect over _maxes and one bisect inside a
+# sublist, and there is no per-key node object: an entry costs a slot in two
+# lists. Sublists hold between load/2 and 2*load keys; a full one is split
+# in half and a small one is merged into its neighbour.
+#
+# rank/select use a Fenwick tree over the sublist lengths. It is updated in
+# O(log(n/load)) on plain inserts and deletes, dropped when sublists are
+# split or merged and rebuilt the next time it is needed.
+# Time Complexity:
+    # - get/floor/ceiling: O(log(n))
+    # - insert/delete: O(log(n) + load) for the list insert/delete
+    # - rank/select: O(log(n)) amortized
+    # - items(lo, hi): O(log(n) + k) for k items in range
+class SortedMap:
+
+
+    def __init__(self, load: int=1000) -> None:
+        if load < 4:
+            raise ValueError('load must be at least 4')
+        self._load: int = load
+        self._keys: List[List] = []
+        self._values: List[List] = []
+        self._maxes: List = []
+        self._len: int = 0
+        self._index: Optional[List[int]] = None   # Fenwick tree of sublist lengths
+
+    @classmethod
+    def from_sorted(cls, items: Iterable[Tuple[Any, Any]], load: int=1000) -> 'SortedMap':
+        '''
+        build from (key, value) pairs already in strictly increasing key
+        order in O(n), instead of inserting them one by one
+        '''
+        m = cls(load)
+        keys, values = [], []
+        for key, value in items:
+            keys.append(key)
+            values.append(value)
+        for i in range(1, len(keys)):
+            if not keys[i-1] < keys[i]:
+                raise ValueError('keys must be strictly increasing')
+
+        m._keys = [keys[i:i + load] for i in range(0, len(keys), load)]
+        m._values = [values[i:i + load] for i in range(0, len(values), load)]
+        m._maxes = [sublist[-1] for sublist in m._keys]
+        m._len = len(keys)
+        return m
+
+    def _build_index(self) -> List[int]:
+        tree = [0] + [len(sublist) for sublist in self._keys]
+        for i in range(1, len(tree)):
+            j = i + (i & -i)
+            if j < len(tree):
+                tree[j] += tree[i]
+        self._index = tree
+        return tree
+
+    def _index_add(self, i: int, delta: int) -> None:
+        tree = self._index
+        if tree is None:
+            return
+        i += 1
+        while i < len(tree):
+            tree[i] += delta
+            i += i & -i
+
+    def _count_before(self, i: int) -> int:
+        '''
+        number of keys in the sublists before sublist i
+        '''
+        tree = self._index or self._build_index()
+        total = 0
+        while i:
+            total += tree[i]
+            i -= i & -i
+        return total
+
+    def _split(self, i: int) -> None:
+        keys, values = self._keys[i], self._values[i]
+        half = len(keys) // 2
+        self._keys[i+1:i+1] = [keys[half:]]
+        self._values[i+1:i+1] = [values[half:]]
+        del keys[half:], values[half:]
+        self._maxes[i:i+1] = [keys[-1], self._keys[i+1][-1]]
+        self._index = None
+
+    def insert(self, key, value=None) -> None:
+        '''
+        map key to value, replacing the value if key is already present
+        '''
+        if not self._maxes:
+            self._keys.append([key])
+            self._values.append([value])
+            self._maxes.append(key)
+            self._len = 1
+            self._index = None
+            return
+
+        i = bisect_left(self._maxes, key)
+        if i == len(self._maxes):
+            i -= 1
+        keys = self._keys[i]
+        j = bisect_left(keys, key)
+        if j < len(keys) and keys[j] == key:
+            self._values[i][j] = value
+            return
+
+        keys.insert(j, key)
+        self._values[i].insert(j, value)
+        self._maxes[i] = keys[-1]
+        self._len += 1
+        if len(keys) > 2 * self._load:
+            self._split(i)
+        else:
+            self._index_add(i, 1)
+
+    def delete(self, key) -> None:
+        '''
+        remove key, raising KeyError if it is not present
+        '''
+        i = bisect_left(self._maxes, key)
+        if i == len(self._maxes):
+            raise KeyError(key)
+        keys = self._keys[i]
+        j = bisect_left(keys, key)
+        if keys[j] != key:
+            raise KeyError(key)
+
+        del keys[j], self._values[i][j]
+        self._len -= 1
+
+        if len(keys) >= self._load // 2 or len(self._keys) == 1:
+            if keys:
+                self._maxes[i] = keys[-1]
+                self._index_add(i, -1)
+            else:
+                del self._keys[i], self._values[i], self._maxes[i]
+                self._index = None
+            return
+
+        # merge the small sublist into its neighbour, splitting again if too big
+        if i == len(self._keys) - 1:
+            i -= 1
+        self._keys[i] += self._keys[i+1]
+        self._values[i] += self._values[i+1]
+        del self._keys[i+1], self._values[i+1], self._maxes[i+1]
+        self._maxes[i] = self._keys[i][-1]
+        self._index = None
+        if len(self._keys[i]) > 2 * self._load:
+            self._split(i)
+
+    def get(self, key, default=None):
+        i = bisect_left(self._maxes, key)
+        if i == len(self._maxes):
+            return default
+        keys = self._keys[i]
+        j = bisect_left(keys, key)
+        return self._values[i][j] if keys[j] == key else default
+
+    def floor(self, key) -> Any:
+        '''
+        return the largest key <= key, or None if there is none
+        '''
+        i = bisect_left(self._maxes, key)
+        if i < len(self._maxes):
+            j = bisect_right(self._keys[i], key)
+            if j:
+                return self._keys[i][j-1]
+        return self._maxes[i-1] if i else None
+
+    def ceiling(self, key) -> Any:
+        '''
+        return the smallest key >= key, or None if there is none
+        '''
+        i = bisect_left(self._maxes, key)
+        if i == len(self._maxes):
+            return None
+        keys = self._keys[i]
+        return keys[bisect_left(keys, key)]
+
+    def rank(self, key) -> int:
+        '''
+        return the number of keys smaller than key
+        '''
+        i = bisect_left(self._maxes, key)
+        if i == len(self._maxes):
+            return self._len
+        return self._count_before(i) + bisect_left(self._keys[i], key)
+
+    def select(self, k: int) -> Any:
+        '''
+        return the key of rank k, i.e. the (k+1)th smallest
+        '''
+        if not 0 <= k < self._len:
+            raise IndexError('k out of range')
+        tree = self._index or self._build_index()
+
+        # descend the Fenwick tree to the last sublist starting at or before k
+        i = 0
+        step = 1 << (len(tree) - 1).bit_length()
+        while step:
+            if i + step < len(tree) and tree[i + step] <= k:
+                i += step
+                k -= tree[i]
+            step >>= 1
+        return self._keys[i][k]
+
+    def items(self, lo=None, hi=None) -> Iterator[Tuple[Any, Any]]:
+        '''
+        yield (key, value) in key order for lo <= key <= hi, either bound
+        open if None
+        '''
+        i, j = 0, 0
+        if lo is not None:
+            i = bisect_left(self._maxes, lo)
+            if i < len(self._maxes):
+                j = bisect_left(self._keys[i], lo)
+
+        while i < len(self._keys):
+            keys, values = self._keys[i], self._values[i]
+            if hi is not None and hi < self._maxes[i]:
+                end = bisect_right(keys, hi, j)
+                yield from zip(keys[j:end], values[j:end])
+                return
+            yield from zip(keys[j:], values[j:])
+            i, j = i + 1, 0
+
+    def __contains__(self, key) -> bool:
+        i = bisect_left(self._maxes, key)
+        if i == len(self._maxes):
+            return False
+        keys = self._keys[i]
+        return keys[bisect_left(keys, key)] == key
+
+    def __iter__(self) -> Iterator:
+        for keys in self._keys:
+            yield from keys
+
+    def __len__(self) -> int:
+        return self._len
+
+
+if __name__ == '__main__':
+
+    m = SortedMap.from_sorted(((k, str(k)) for k in range(0, 40, 2)), load=4)
+    m.insert(7, '7')
+    m.delete(10)
+    print(list(m))
+    print('floor(10):', m.floor(10), 'ceiling(10):', m.ceiling(10))
+    print('rank(12):', m.rank(12), 'select(5):', m.select(5))
+    print('items(5, 13):', list(m.items(5, 13)))
@@ -1,5 +1,39 @@
-from typing import Dict, List
+import mmap
+import os
+import stat
+import struct
+import tempfile
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Hashable, Iterable, Iterator, List, Optional, Sequence, Set
 
+try:
+    import numpy as np
+except ImportError:   # numpy is optional, CompactUnionFind falls back to a loop
+    np = None
+
+# union_many/find_many batches at least this long (and at least n / 16, since
+# each vectorized round touches the whole array) go through numpy
+NUMPY_THRESHOLD = 10_000
+
+# edge lists shorter than this are not worth starting worker processes for
+PARALLEL_THRESHOLD = 100_000
+
+# file layout of CompactUnionFind.save: magic, typecode, 3 pad bytes, n, count,
+# then _id and _size as raw arrays
+_FILE_MAGIC = b'UFC1'
+_FILE_HEADER = struct.Struct('<4sc3xqq')
+
+# Weighted quick-union with path compression. Besides the parent array, every
+# element has a _next pointer, and the members of a component form a circular
+# linked list through it: union splices the two circles together by swapping
+# the _next pointers of their roots. The set of live roots is kept alongside,
+# so listing one component costs its size and listing all of them costs n,
+# without calling _root on every element.
+# Time Complexity:
+    # - union/connected/find: O(α(n)) amortized
+    # - get_set: O(size of the component)
+    # - get_all_sets: O(n), iter_roots: O(number of components)
 class UnionFind:
 
     def __init__(self, n: int) -> None:
@@ -7,6 +41,9 @@ class UnionFind:
         self._count: int = n          # number of connected components
         self._size: List[int] = [1] * n
         self._id: List[int] = [i for i in range(n)]
+        # share the int objects of _id instead of creating n more of each
+        self._next: List[int] = self._id.copy()   # circular list of each component
+        self._roots: Set[int] = set(self._id)
         self._n: int = n
 
     
@@ -66,37 +103,482 @@ class UnionFind:
             if self._size[i] < self._size[j]:
                 self._id[i] = j
                 self._size[j] += self._size[i] 
+                self._roots.discard(i)
             else:
                 self._id[j] = i
                 self._size[i] += self._size[j]  
+                self._roots.discard(j)
+
+            # splice the two circular member lists into one
+            self._next[i], self._next[j] = self._next[j], self._next[i]
 
             self._count -= 1   # one less component sinced union'd
 
 
+    def find(self, p: int) -> int:
+        '''
+        return the root of the component containing p
+        '''
+        return self._root(p)
+
+
+    def union_many(self, ps: Iterable[int], qs: Iterable[int]) -> None:
+        '''
+        union(p, q) for every pair of edges (ps[i], qs[i])
+        '''
+        for p, q in zip(ps, qs):
+            self.union(p, q)
+
+
+    def find_many(self, xs: Iterable[int]) -> List[int]:
+        '''
+        return the root of every x in xs
+        '''
+        return [self._root(x) for x in xs]
+
+
+    def merge(self, other: 'UnionFind') -> None:
+        '''
+        union in every connection of other, a union-find over the same
+        points, by replaying one union per point that is not a root there
+        '''
+        for i in range(other._n):
+            root = other._root(i)
+            if root != i:
+                self.union(i, root)
+
+
     def get_set(self, p: int) -> List[int]: 
         '''
-        given a point p, return all points it is connected to 
+        given a point p, return all points it is connected to, starting with p
         '''
-        root = self._root(p) 
-        return [i for i in range(self._n) if root == self._root(self._id[i])]
+        members = [p]
+        i = self._next[p]
+        while i != p:
+            members.append(i)
+            i = self._next[i]
+        return members
+
+
+    def iter_roots(self) -> Iterator[int]:
+        '''
+        yield the root of every component. Iterates over a copy of the
+        roots, so unions made meanwhile do not affect it.
+        '''
+        return iter(list(self._roots))
 
 
     def get_all_sets(self) -> List[List[int]]:
-        root_idx_map: Dict[int, int] = {}
-        curr_set_id: int = 0
-        result: List[List[int]] = []
-
-        for i, id in enumerate(self._id):
-            root = self._root(i)
-            try:
-                set_id = root_idx_map[root]
-                result[set_id].append(i)
-            except KeyError:
-                root_idx_map[root] = curr_set_id
-                set_id = curr_set_id
-                curr_set_id += 1
-                result.append([i])
-        return result
+        return [self.get_set(root) for root in self._roots]
+
+
+def _file_mode(path: str) -> int:
+    '''
+    permissions for a file written to path: those of the file it replaces,
+    else what open() would give a new file under the current umask
+    '''
+    try:
+        return stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        umask = os.umask(0)
+        os.umask(umask)
+        return 0o666 & ~umask
+
+
+# UnionFind with _id and _size packed into typed arrays (4 bytes per entry
+# while n < 2**31) instead of lists of int objects, and without the member
+# lists, so it costs 8 bytes per element instead of well over 60.
+#
+# With numpy installed, large union_many batches are done by hooking and
+# pointer jumping over a numpy view of the same buffer: every round flattens
+# the forest, then hooks the larger root of each edge that still crosses two
+# components onto the smallest root it touches, until no edge crosses.
+# Components come out the same as with scalar unions, roots may differ.
+# Time Complexity:
+    # - union/connected/find: O(α(n)) amortized
+    # - union_many (numpy): O((n + m) * rounds), a few rounds in practice
+    # - get_set/get_all_sets/iter_roots: O(n)
+class CompactUnionFind(UnionFind):
+
+    def __init__(self, n: int) -> None:
+
+        self._typecode: str = 'i' if n < 2**31 else 'q'
+        self._count: int = n
+        self._size: array = array(self._typecode, [1]) * n
+        self._id: array = array(self._typecode, range(n))
+        self._n: int = n
+        self._mmap: Optional[mmap.mmap] = None   # backing file mapping after load()
+
+
+    def union(self, p: int, q: int) -> None:
+        i = self._root(p)
+        j = self._root(q)
+
+        if i != j:
+            if self._size[i] < self._size[j]:
+                self._id[i] = j
+                self._size[j] += self._size[i]
+            else:
+                self._id[j] = i
+                self._size[i] += self._size[j]
+            self._count -= 1
+
+
+    def _use_numpy(self, batch_size: int) -> bool:
+        return np is not None and batch_size >= max(NUMPY_THRESHOLD, self._n // 16)
+
+
+    def _flatten(self):
+        '''
+        point every element straight at its root and return the numpy view of _id
+        '''
+        parent = np.frombuffer(self._id, dtype=self._typecode)
+        while True:
+            grandparent = parent[parent]
+            if np.array_equal(grandparent, parent):
+                return parent
+            parent[:] = grandparent
+
+
+    def union_many(self, ps: Sequence[int], qs: Sequence[int]) -> None:
+        '''
+        union(p, q) for every pair of edges (ps[i], qs[i]). ps and qs may be
+        lists or integer numpy arrays of the same length.
+        '''
+        if not self._use_numpy(len(ps)):
+            union = self.union
+            for p, q in zip(ps, qs):
+                union(p, q)
+            return
+
+        ps = np.asarray(ps, dtype=np.int64)
+        qs = np.asarray(qs, dtype=np.int64)
+        while True:
+            parent = self._flatten()
+            rp, rq = parent[ps], parent[qs]
+            crossing = rp != rq
+            if not crossing.any():
+                break
+            rp, rq = rp[crossing], rq[crossing]
+            # roots point at smaller roots only, so no cycles can form
+            np.minimum.at(parent, np.maximum(rp, rq), np.minimum(rp, rq))
+            ps, qs = rp, rq
+
+        size = np.frombuffer(self._size, dtype=self._typecode)
+        size[:] = np.bincount(parent, minlength=self._n)   # only roots' sizes are read
+        self._count = int(np.count_nonzero(parent == np.arange(self._n)))
+
+
+    def merge(self, other: UnionFind) -> None:
+        if not self._use_numpy(other._n):
+            super().merge(other)
+            return
+        roots = np.asarray(other.find_many(range(other._n)), dtype=np.int64)
+        moved = np.flatnonzero(roots != np.arange(other._n))
+        self.union_many(moved, roots[moved])
+
+
+    def find_many(self, xs: Sequence[int]):
+        '''
+        return the root of every x in xs, as a numpy array if xs is one
+        '''
+        if np is not None and isinstance(xs, np.ndarray):
+            if self._use_numpy(len(xs)):
+                return self._flatten()[xs]
+            return np.fromiter((self._root(x) for x in xs.tolist()), dtype=np.int64, count=len(xs))
+        if self._use_numpy(len(xs)):
+            return self._flatten()[np.asarray(xs)].tolist()
+        return [self._root(x) for x in xs]
+
+
+    def get_set(self, p: int) -> List[int]:
+        '''
+        given a point p, return all points it is connected to
+        '''
+        root = self._root(p)
+        if np is not None:
+            return np.flatnonzero(self._flatten() == root).tolist()
+        return [i for i in range(self._n) if root == self._root(i)]
+
+
+    def iter_roots(self) -> Iterator[int]:
+        '''
+        yield the root of every component
+        '''
+        return (i for i, parent in enumerate(self._id) if i == parent)
+
+
+    def get_all_sets(self) -> List[List[int]]:
+        sets: Dict[int, List[int]] = {}
+        for i in range(self._n):
+            sets.setdefault(self._root(i), []).append(i)
+        return list(sets.values())
+
+
+    def save(self, path: str) -> None:
+        '''
+        write the structure to path in a form load() can map back in.
+        The data goes to a temporary file next to path which then replaces
+        it, so saving a loaded instance over its own file never truncates
+        the file under the live mapping.
+        '''
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)))
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(_FILE_HEADER.pack(_FILE_MAGIC, self._typecode.encode(), self._n, self._count))
+                f.write(self._id)
+                f.write(self._size)
+            os.chmod(tmp_path, _file_mode(path))
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+
+
+    def __getstate__(self) -> Dict:
+        '''
+        pickle a loaded instance by copying its arrays out of the mapping
+        '''
+        state = self.__dict__.copy()
+        if self._mmap is not None:
+            state['_id'] = array(self._typecode, self._id.tobytes())
+            state['_size'] = array(self._typecode, self._size.tobytes())
+            state['_mmap'] = None
+        return state
+
+
+    @classmethod
+    def load(cls, path: str) -> 'CompactUnionFind':
+        '''
+        open a file written by save(). The file is memory mapped rather than
+        read, so this is O(1) and pages are only loaded as they are touched.
+        The mapping is copy-on-write: unions change this object, not the
+        file, until it is saved again, which is safe to do to the same path.
+        '''
+        with open(path, 'rb') as f:
+            mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+
+        magic, typecode, n, count = _FILE_HEADER.unpack_from(mapping)
+        if magic != _FILE_MAGIC:
+            mapping.close()
+            raise ValueError(f'{path} is not a saved CompactUnionFind')
+        typecode = typecode.decode()
+        itemsize = array(typecode).itemsize
+
+        uf = cls.__new__(cls)
+        uf._typecode = typecode
+        uf._count = count
+        uf._n = n
+        uf._mmap = mapping
+        buf = memoryview(mapping)
+        start = _FILE_HEADER.size
+        uf._id = buf[start:start + n*itemsize].cast(typecode)
+        uf._size = buf[start + n*itemsize:start + 2*n*itemsize].cast(typecode)
+        return uf
+
+
+def _build_shard(n: int, ps: Sequence[int], qs: Sequence[int]) -> CompactUnionFind:
+    '''
+    worker: union-find over n points of one shard of the edges
+    '''
+    uf = CompactUnionFind(n)
+    uf.union_many(ps, qs)
+    return uf
+
+
+def parallel_union_find(n: int, ps: Sequence[int], qs: Sequence[int], workers: Optional[int]=None) -> CompactUnionFind:
+    '''
+    Build a CompactUnionFind over n points from the edges (ps[i], qs[i])
+    across worker processes. Each worker gets a contiguous shard of the
+    edges and builds its own union-find over all n points, which is
+    pickled back as two typed arrays. The shards are then merged into the
+    first one, which costs at most n - 1 unions each no matter how many
+    edges they saw. Edge lists shorter than PARALLEL_THRESHOLD are handled
+    in this process.
+
+    O(m/workers) unions per worker plus O(n*workers) to merge
+    '''
+    m = len(ps)
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or m < PARALLEL_THRESHOLD:
+        return _build_shard(n, ps, qs)
+
+    step = -(-m // workers)
+    with ProcessPoolExecutor(workers) as executor:
+        shards = list(executor.map(_build_shard, [n] * workers,
+                                   (ps[lo:lo + step] for lo in range(0, m, step)),
+                                   (qs[lo:lo + step] for lo in range(0, m, step))))
+
+    uf = shards[0]
+    for shard in shards[1:]:
+        uf.merge(shard)
+    return uf
+
+# UnionFind that can undo unions, for offline algorithms that branch and
+# backtrack. Without path compression a union changes only one parent link,
+# one size, the member lists and the set of roots, so each union pushes the
+# root it attached onto a log and undoing it restores those in O(1).
+# Union by size alone keeps trees O(log(n)) deep.
+# snapshot() is just the log length; rollback(snapshot) undoes everything
+# done since.
+# Time Complexity:
+    # - union/connected/find: O(log(n))
+    # - snapshot: O(1), rollback: O(1) per union undone
+class RollbackUnionFind(UnionFind):
+
+    def __init__(self, n: int) -> None:
+
+        super().__init__(n)
+        self._log: List[int] = []   # roots attached by each union, oldest first
+
+
+    def _root(self, i: int) -> int:
+        '''
+        return root of i, without path compression
+        '''
+        while i != self._id[i]:
+            i = self._id[i]
+        return i
+
+
+    def union(self, p: int, q: int) -> None:
+        i = self._root(p)
+        j = self._root(q)
+
+        if i != j:
+            if self._size[i] < self._size[j]:
+                i, j = j, i
+            self._id[j] = i
+            self._size[i] += self._size[j]
+            self._next[i], self._next[j] = self._next[j], self._next[i]
+            self._roots.discard(j)
+            self._count -= 1
+            self._log.append(j)
+
+
+    def snapshot(self) -> int:
+        '''
+        return a marker that rollback() can return to
+        '''
+        return len(self._log)
+
+
+    def undo(self) -> None:
+        '''
+        undo the most recent union that merged two components
+        '''
+        if not self._log:
+            raise IndexError('Nothing to undo')
+        j = self._log.pop()
+        i = self._id[j]
+        self._id[j] = j
+        self._size[i] -= self._size[j]
+        self._next[i], self._next[j] = self._next[j], self._next[i]
+        self._roots.add(j)
+        self._count += 1
+
+
+    def rollback(self, snapshot: int) -> None:
+        '''
+        undo every union made since snapshot() returned snapshot
+        '''
+        if not 0 <= snapshot <= len(self._log):
+            raise ValueError('snapshot is not in the log')
+        while len(self._log) > snapshot:
+            self.undo()
+
+
+# UnionFind over arbitrary hashable keys. A key gets the next integer slot the
+# first time union or add sees it; slots are appended to the same lists
+# UnionFind uses, so they grow like any list and member lists, live roots and
+# path compression all carry over. Queries about keys never seen neither add
+# them nor fail: an unseen key is a component of its own.
+# Time Complexity:
+    # - add/union/connected/find: O(α(n)) amortized
+    # - get_set: O(size of the component)
+class KeyedUnionFind(UnionFind):
+
+    def __init__(self, keys: Iterable[Hashable]=()) -> None:
+
+        super().__init__(0)
+        self._index: Dict[Hashable, int] = {}    # key -> slot
+        self._keys: List[Hashable] = []          # slot -> key
+        for key in keys:
+            self.add(key)
+
+
+    def add(self, key: Hashable) -> int:
+        '''
+        make key a component of its own if it is new, and return its slot
+        '''
+        i = self._index.get(key)
+        if i is None:
+            i = self._index[key] = self._n
+            self._keys.append(key)
+            self._id.append(i)
+            self._size.append(1)
+            self._next.append(i)
+            self._roots.add(i)
+            self._n += 1
+            self._count += 1
+        return i
+
+
+    def union(self, p: Hashable, q: Hashable) -> None:
+        super().union(self.add(p), self.add(q))
+
+
+    def find(self, p: Hashable) -> Hashable:
+        '''
+        return the key at the root of the component containing p
+        '''
+        i = self._index.get(p)
+        return p if i is None else self._keys[self._root(i)]
+
+
+    def connected(self, p: Hashable, q: Hashable) -> bool:
+        i, j = self._index.get(p), self._index.get(q)
+        if i is None or j is None:
+            return p == q
+        return self._root(i) == self._root(j)
+
+
+    def merge(self, other: 'KeyedUnionFind') -> None:
+        for i in range(other._n):
+            root = other._root(i)
+            if root != i:
+                self.union(other._keys[i], other._keys[root])
+
+
+    def find_many(self, xs: Iterable[Hashable]) -> List[Hashable]:
+        return [self.find(x) for x in xs]
+
+
+    def get_set(self, p: Hashable) -> List[Hashable]:
+        '''
+        given a key p, return all keys it is connected to, starting with p
+        '''
+        i = self._index.get(p)
+        if i is None:
+            return [p]
+        return [self._keys[j] for j in super().get_set(i)]
+
+
+    def iter_roots(self) -> Iterator[Hashable]:
+        return (self._keys[i] for i in list(self._roots))
+
+
+    def get_all_sets(self) -> List[List[Hashable]]:
+        return [self.get_set(self._keys[i]) for i in self._roots]
+
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._index
+
+
+    def __len__(self) -> int:
+        return self._n
+
 
 if '__main__' == __name__:
 
@@ -119,3 +601,43 @@ if '__main__' == __name__:
     print(uf._id)
     print(uf.get_set(0))
     print(uf.get_all_sets())
+
+    cuf = CompactUnionFind(10)
+    cuf.union_many([0, 1, 4, 4, 0, 6], [9, 5, 8, 3, 8, 7])
+    assert cuf.count() == uf.count()
+    print(cuf.find_many(range(10)))
+    print(cuf.get_all_sets())
+
+    kuf = KeyedUnionFind()
+    kuf.union('alice@example.com', 'alice')
+    kuf.union('a.smith', 'alice')
+    kuf.add('bob')
+    assert kuf.connected('a.smith', 'alice@example.com')
+    assert not kuf.connected('bob', 'carol')
+    print(kuf.count(), len(kuf), kuf.get_set('alice'))
+
+    import pickle
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, 'uf.bin')
+        cuf.save(path)
+        loaded = CompactUnionFind.load(path)
+        assert loaded.count() == cuf.count() and loaded.connected(3, 9)
+        print(loaded.get_set(9))
+
+        # save over the file the instance is mapped from, then reopen it
+        loaded.union(2, 6)
+        loaded.save(path)
+        reloaded = CompactUnionFind.load(path)
+        assert reloaded.count() == cuf.count() - 1 and reloaded.connected(2, 7)
+        assert pickle.loads(pickle.dumps(reloaded)).get_all_sets() == reloaded.get_all_sets()
+        del loaded, reloaded
+
+    ruf = RollbackUnionFind(10)
+    ruf.union(0, 9)
+    before = ruf.snapshot()
+    ruf.union(9, 4)
+    ruf.union(4, 3)
+    assert ruf.connected(0, 3)
+    ruf.rollback(before)
+    assert ruf.count() == 9 and not ruf.connected(0, 3) and ruf.connected(0, 9)
+    print(ruf.get_all_sets())
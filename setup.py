@@ -1,3 +1,4 @@
 from setuptools import setup
 
-setup(name='data_structures', version='1.0', packages=['data_structures'])
\ No newline at end of file
+setup(name='data_structures', version='1.0', packages=['data_structures'],
+      extras_require={'numpy': ['numpy']})
\ No newline at end of file